@@ -1,37 +1,373 @@
 import heapq
+import threading
+from array import array
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Set, Optional
 
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Fallback decorator that leaves the function as plain Python."""
+        def decorator(func):
+            return func
+        return decorator
+
+
+# Larger than any path cost a maze can produce
+_INF = 2 ** 30
+
+# Number of goals whose heuristic tables an AStar instance keeps
+_H_CACHE_SIZE = 16
+
+
+# Bits of a cell's open-direction mask
+OPEN_RIGHT = 1
+OPEN_LEFT = 2
+OPEN_DOWN = 4
+OPEN_UP = 8
+
+# (dx, dy) for each single-bit direction mask
+_DIRECTION_DELTAS = {OPEN_RIGHT: (1, 0), OPEN_LEFT: (-1, 0), OPEN_DOWN: (0, 1), OPEN_UP: (0, -1)}
+
+
+def _push_batch(open_set: list, pending: list):
+    """Add the entries relaxed by one expansion to a heapq open set.
+    
+    Pushing k entries costs O(k log n) while re-heapifying costs O(n), so
+    the batch is appended and the heap rebuilt only when that is cheaper,
+    which happens while the open set is still small.
+    """
+    n = len(open_set) + len(pending)
+    if len(pending) * n.bit_length() > n:
+        open_set.extend(pending)
+        heapq.heapify(open_set)
+    else:
+        for entry in pending:
+            heapq.heappush(open_set, entry)
+
+
+def _direction_steps(width: int) -> List[int]:
+    """Return the cell-id offset for each single-bit direction mask."""
+    step = [0] * (OPEN_UP + 1)
+    for bit, (dx, dy) in _DIRECTION_DELTAS.items():
+        step[bit] = dy * width + dx
+    return step
+
+
+def open_direction_mask(wall_h: np.ndarray, wall_v: np.ndarray) -> np.ndarray:
+    """Pack the passable directions of every cell into one byte.
+    
+    Boundary and wall checks for all four directions are folded into a
+    uint8 per cell, so a search visits neighbors by iterating set bits
+    instead of branching on each direction.
+    
+    Returns:
+        uint8 array of OPEN_* bits indexed by cell id (y * width + x)
+    """
+    width, height = wall_h.shape[0], wall_v.shape[1]
+    mask = np.zeros((height, width), dtype=np.uint8)
+    open_v = (~wall_v.T).astype(np.uint8)
+    open_h = (~wall_h.T).astype(np.uint8)
+    mask[:, :-1] |= open_v * OPEN_RIGHT
+    mask[:, 1:] |= open_v * OPEN_LEFT
+    mask[:-1, :] |= open_h * OPEN_DOWN
+    mask[1:, :] |= open_h * OPEN_UP
+    return mask.ravel()
+
+
+@njit(cache=True, nogil=True)
+def _astar_core(W, H, open_mask, h_table, start_id, end_id, explored, out_path):
+    """Run A* over linear cell ids.
+    
+    `open_mask` holds the open-direction bits of every cell (see
+    `open_direction_mask`) and `h_table` its heuristic, both indexed by
+    cell id. Like a C routine, results go to caller-owned buffers: expanded
+    ids are written in order to the front of `explored` and the path ids
+    from start to end to the front of `out_path`, each sized W * H.
+    
+    Returns:
+        Tuple of (path length, number of expanded ids). The path length is
+        0 if the end is unreachable.
+    """
+    size = W * H
+    
+    # Heap keys are f * stride + h: h < stride, so keys order by f and
+    # break ties towards the lower h, i.e. the deeper node
+    stride = W + H
+    
+    # Id offset for each single-bit direction mask
+    step = np.zeros(9, dtype=np.int64)
+    step[OPEN_RIGHT] = 1
+    step[OPEN_LEFT] = -1
+    step[OPEN_DOWN] = W
+    step[OPEN_UP] = -W
+    
+    g_score = np.full(size, _INF, dtype=np.int32)
+    came_from = np.full(size, -1, dtype=np.int32)
+    closed = np.zeros(size, dtype=np.bool_)
+    n_explored = 0
+    
+    # 4-ary heap of (key, cid); with lazy deletion every relaxation may add
+    # an entry, which bounds the heap by one push per edge direction
+    heap_f = np.empty(4 * size + 1, dtype=np.int64)
+    heap_cid = np.empty(4 * size + 1, dtype=np.int32)
+    heap_f[0] = h_table[start_id] * (stride + 1)
+    heap_cid[0] = start_id
+    n = 1
+    g_score[start_id] = 0
+    
+    # Cost of the best path to the end found so far
+    best_goal = _INF
+    
+    found = False
+    while n > 0:
+        # Nothing left can beat the best known path: the end is settled
+        if heap_f[0] >= best_goal * stride:
+            explored[n_explored] = end_id
+            n_explored += 1
+            found = True
+            break
+        current = heap_cid[0]
+        
+        # Pop the root and sift the last record down
+        n -= 1
+        if n > 0:
+            last_f = heap_f[n]
+            last_cid = heap_cid[n]
+            i = 0
+            while True:
+                first = 4 * i + 1
+                if first >= n:
+                    break
+                child = first
+                for c in range(first + 1, min(first + 4, n)):
+                    if heap_f[c] < heap_f[child]:
+                        child = c
+                if heap_f[child] >= last_f:
+                    break
+                heap_f[i] = heap_f[child]
+                heap_cid[i] = heap_cid[child]
+                i = child
+            heap_f[i] = last_f
+            heap_cid[i] = last_cid
+        
+        # Skip stale entries
+        if closed[current]:
+            continue
+        closed[current] = True
+        explored[n_explored] = current
+        n_explored += 1
+        
+        if current == end_id:
+            found = True
+            break
+        
+        g = g_score[current] + 1
+        
+        # Visit only the set bits of the cell's open-direction mask
+        m = np.int64(open_mask[current])
+        while m:
+            bit = m & -m
+            m ^= bit
+            neighbor = current + step[bit]
+            if closed[neighbor] or g >= g_score[neighbor]:
+                continue
+            h = h_table[neighbor]
+            f = g + h
+            if neighbor == end_id:
+                best_goal = g
+            elif f >= best_goal:
+                # Cannot lead to a shorter path than the one already found
+                continue
+            came_from[neighbor] = current
+            g_score[neighbor] = g
+            key = np.int64(f) * stride + h
+            
+            # Push and sift up
+            i = n
+            n += 1
+            while i > 0:
+                parent = (i - 1) // 4
+                if heap_f[parent] <= key:
+                    break
+                heap_f[i] = heap_f[parent]
+                heap_cid[i] = heap_cid[parent]
+                i = parent
+            heap_f[i] = key
+            heap_cid[i] = neighbor
+    
+    if not found:
+        return 0, n_explored
+    
+    # Walk the parents from the end, then reverse in place
+    length = 0
+    current = end_id
+    while current != -1:
+        out_path[length] = current
+        length += 1
+        current = came_from[current]
+    for i in range(length // 2):
+        tmp = out_path[i]
+        out_path[i] = out_path[length - 1 - i]
+        out_path[length - 1 - i] = tmp
+    return length, n_explored
+
+
+def walls_to_arrays(width: int, height: int,
+                    walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert a set of wall cell pairs into edge arrays in one vectorized pass.
+    
+    Returns:
+        Tuple (wall_h, wall_v): wall_h[x, y] is a wall between (x, y) and
+        (x, y + 1), wall_v[x, y] a wall between (x, y) and (x + 1, y).
+        Pairs that are not adjacent cells inside the maze are ignored.
+    """
+    wall_h = np.zeros((width, max(height - 1, 0)), dtype=bool)
+    wall_v = np.zeros((max(width - 1, 0), height), dtype=bool)
+    if walls:
+        x1, y1, x2, y2 = np.array(list(walls), dtype=np.int64).reshape(-1, 4).T
+        x = np.minimum(x1, x2)
+        y = np.minimum(y1, y2)
+        inside = (x >= 0) & (y >= 0)
+        vertical = inside & (y1 == y2) & (np.abs(x1 - x2) == 1) & (x < width - 1) & (y < height)
+        horizontal = inside & (x1 == x2) & (np.abs(y1 - y2) == 1) & (x < width) & (y < height - 1)
+        wall_v[x[vertical], y[vertical]] = True
+        wall_h[x[horizontal], y[horizontal]] = True
+    return wall_h, wall_v
+
+
+class DAryHeap:
+    """Min-heap of (f, cid) records with four children per node.
+    
+    A 4-ary heap is half as deep as a binary one, so each push does fewer
+    comparisons and each pop picks the smallest of four adjacent children.
+    """
+    
+    ARITY = 4
+    
+    def __init__(self, capacity: int = 64):
+        """Initialize an empty heap with room for `capacity` records."""
+        self._data = np.empty(max(capacity, 1), dtype=np.dtype([('f', 'f4'), ('cid', 'i4')]))
+        self._f = self._data['f']
+        self._cid = self._data['cid']
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def _grow(self):
+        """Double the capacity of the backing array."""
+        data = np.empty(len(self._data) * 2, dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+        self._f = data['f']
+        self._cid = data['cid']
+    
+    def push(self, f: float, cid: int):
+        """Insert a record, sifting it up towards the root."""
+        n = self._size
+        if n == len(self._data):
+            self._grow()
+        fs = self._f
+        cids = self._cid
+        
+        i = n
+        while i > 0:
+            parent = (i - 1) // self.ARITY
+            if fs[parent] <= f:
+                break
+            fs[i] = fs[parent]
+            cids[i] = cids[parent]
+            i = parent
+        fs[i] = f
+        cids[i] = cid
+        self._size = n + 1
+    
+    def pop(self) -> Tuple[float, int]:
+        """Remove and return the record with the smallest f."""
+        fs = self._f
+        cids = self._cid
+        top = (float(fs[0]), int(cids[0]))
+        
+        n = self._size - 1
+        self._size = n
+        if n > 0:
+            # Move the last record down from the root, picking the
+            # smallest of up to four children in a single argmin
+            last_f = fs[n]
+            last_cid = cids[n]
+            i = 0
+            while True:
+                first = i * self.ARITY + 1
+                if first >= n:
+                    break
+                child = first + int(np.argmin(fs[first:min(first + self.ARITY, n)]))
+                if fs[child] >= last_f:
+                    break
+                fs[i] = fs[child]
+                cids[i] = cids[child]
+                i = child
+            fs[i] = last_f
+            cids[i] = last_cid
+        return top
+
 
 class AStar:
-    def __init__(self, width: int, height: int, walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]]):
-        """Initialize the A* algorithm with maze dimensions and walls."""
+    def __init__(self, width: int, height: int, walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+                 wall_h: Optional[np.ndarray] = None, wall_v: Optional[np.ndarray] = None):
+        """Initialize the A* algorithm with maze dimensions and walls.
+        
+        Args:
+            width: Width of the maze in cells
+            height: Height of the maze in cells
+            walls: Set of wall tuples, converted to edge arrays if the arrays are not given
+            wall_h: Optional (width, height - 1) bool array of walls below each cell
+            wall_v: Optional (width - 1, height) bool array of walls right of each cell
+        """
         self.width = width
         self.height = height
-        self.walls = walls
-        # Track the nodes we've explored for visualization
-        self.explored_nodes = set()
+        # Track the nodes we've explored for visualization: cell ids in
+        # expansion order, written through a cursor into a preallocated array
+        self._explored_order = np.empty(width * height, dtype=np.int32)
+        # Output buffer for the path ids written by the compiled search
+        self._path_buffer = np.empty(width * height, dtype=np.int32)
+        # Heuristic tables of recent goals, keyed by (goal id, backend)
+        self._h_cache: Dict[Tuple[int, bool], object] = {}
+        # find_paths_batch queries from several threads, so cache updates are locked
+        self._h_cache_lock = threading.Lock()
+        self.reset(walls, wall_h, wall_v)
     
-    def _get_neighbors(self, node: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Get valid neighboring cells for a given node."""
-        x, y = node
-        neighbors = []
+    def reset(self, walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+              wall_h: Optional[np.ndarray] = None, wall_v: Optional[np.ndarray] = None):
+        """Switch to new walls of the same size, keeping the search buffers.
         
-        # Check all four adjacent cells
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            nx, ny = x + dx, y + dy
-            
-            # Check if the neighbor is within the maze boundaries
-            if 0 <= nx < self.width and 0 <= ny < self.height:
-                # Check if there's no wall between the current node and the neighbor
-                wall = tuple(sorted([(x, y), (nx, ny)]))
-                if wall not in self.walls:
-                    neighbors.append((nx, ny))
+        The heuristic tables only depend on the maze size and stay cached.
         
-        return neighbors
-    
-    def _heuristic(self, a: Tuple[int, int], b: Tuple[int, int]) -> int:
-        """Manhattan distance heuristic."""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        Args:
+            walls: Set of wall tuples, converted to edge arrays if the arrays are not given
+            wall_h: Optional (width, height - 1) bool array of walls below each cell
+            wall_v: Optional (width - 1, height) bool array of walls right of each cell
+        """
+        self.walls = walls
+        # Walls as edge arrays: wall_h[x, y] blocks (x, y) <-> (x, y + 1),
+        # wall_v[x, y] blocks (x, y) <-> (x + 1, y). Given arrays are copied:
+        # MazeGenerator refills its arrays in place on regeneration, and every
+        # search here must keep seeing the maze _open_mask was built from
+        if wall_h is None or wall_v is None:
+            wall_h, wall_v = walls_to_arrays(self.width, self.height, walls)
+        else:
+            wall_h, wall_v = wall_h.copy(), wall_v.copy()
+        self.wall_h = wall_h
+        self.wall_v = wall_v
+        self._open_mask = open_direction_mask(wall_h, wall_v)
+        self._explored_n = 0
     
     def find_path(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
         """Find the shortest path from start to end using A* algorithm.
@@ -43,61 +379,637 @@ class AStar:
         Returns:
             List of coordinates representing the path from start to end, or None if no path exists
         """
-        # Reset explored nodes
-        self.explored_nodes = set()
+        size = self.width * self.height
         
-        # Priority queue for open nodes
-        open_set = []
-        heapq.heappush(open_set, (0, start))
+        # At most every cell is expanded once, and a path visits each cell once
+        if len(self._explored_order) < size:
+            self._explored_order = np.empty(size, dtype=np.int32)
+            self._path_buffer = np.empty(size, dtype=np.int32)
         
-        # For tracking where nodes came from
-        came_from: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
-        came_from[start] = None
+        path, self._explored_n = self._run_search(start, end, self._explored_order, self._path_buffer)
+        return path
+    
+    def find_paths_batch(self, pairs: List[Tuple[Tuple[int, int], Tuple[int, int]]],
+                         max_workers: Optional[int] = None) -> List[Optional[List[Tuple[int, int]]]]:
+        """Find paths for many (start, end) pairs concurrently.
         
-        # Cost from start to each node
-        g_score: Dict[Tuple[int, int], float] = {start: 0}
+        Each search gets its own buffers and is submitted to a thread pool.
+        The compiled kernel releases the GIL, so with Numba the searches run
+        in parallel; the pure-Python fallback still works but is serialized
+        by the GIL. Explored nodes of batched searches are not recorded.
         
-        # Estimated total cost from start to goal through each node
-        f_score: Dict[Tuple[int, int], float] = {start: self._heuristic(start, end)}
+        Args:
+            pairs: List of (start, end) coordinate pairs
+            max_workers: Optional thread pool size (default: Python's choice)
+            
+        Returns:
+            List of paths (or None where no path exists) in the order of `pairs`
+        """
+        size = self.width * self.height
         
-        # Set of visited nodes
-        open_set_hash = {start}
+        def search(pair):
+            start, end = pair
+            explored = np.empty(size, dtype=np.int32)
+            out_path = np.empty(size, dtype=np.int32)
+            return self._run_search(start, end, explored, out_path)[0]
         
-        while open_set:
-            # Get the node with the lowest f_score
-            _, current = heapq.heappop(open_set)
-            open_set_hash.remove(current)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(search, pairs))
+    
+    def _run_search(self, start: Tuple[int, int], end: Tuple[int, int], explored: np.ndarray,
+                    out_path: np.ndarray) -> Tuple[Optional[List[Tuple[int, int]]], int]:
+        """Run one A* search with the best available backend.
+        
+        Returns:
+            Tuple of (path coordinates or None, number of expanded ids in `explored`)
+        """
+        W = self.width
+        
+        # Cells are addressed by linear ids (y * W + x) inside the search
+        start_id = start[1] * W + start[0]
+        end_id = end[1] * W + end[0]
+        
+        h_table = self._heuristic_table(end)
+        
+        if NUMBA_AVAILABLE:
+            length, n_explored = _astar_core(W, self.height, self._open_mask, h_table,
+                                             start_id, end_id, explored, out_path)
+            path_ids = out_path[:length].tolist() if length else None
+        else:
+            path_ids, n_explored = self._search(start_id, end_id, h_table, explored)
+        
+        # Convert ids back to coordinates at the API boundary
+        if path_ids is None:
+            return None, n_explored
+        return [(cid % W, cid // W) for cid in path_ids], n_explored
+    
+    def _heuristic_table(self, end: Tuple[int, int]):
+        """Return the Manhattan distance from every cell to `end`, indexed by cell id.
+        
+        Tables are memoized per goal, so repeated queries towards the same end
+        skip rebuilding them. The table is an int32 array for the compiled
+        kernel and a plain list for the pure-Python search.
+        """
+        key = (end[1] * self.width + end[0], NUMBA_AVAILABLE)
+        h_table = self._h_cache.get(key)
+        if h_table is None:
+            xs = np.abs(np.arange(self.width) - end[0])
+            ys = np.abs(np.arange(self.height) - end[1])
+            h_table = (ys[:, None] + xs[None, :]).astype(np.int32).ravel()
+            if not NUMBA_AVAILABLE:
+                h_table = h_table.tolist()
+            # Evict the oldest goal once the cache is full
+            with self._h_cache_lock:
+                if len(self._h_cache) >= _H_CACHE_SIZE:
+                    self._h_cache.pop(next(iter(self._h_cache)), None)
+                self._h_cache[key] = h_table
+        return h_table
+    
+    def _search(self, start_id: int, end_id: int, h_table: List[int],
+                explored: np.ndarray) -> Tuple[Optional[List[int]], int]:
+        """Pure-Python A* over linear cell ids, used when Numba is unavailable.
+        
+        `h_table` holds the heuristic of every cell, indexed by cell id. Expanded
+        ids are written in order to the front of the preallocated `explored`.
+        
+        Returns:
+            Tuple of (path ids or None, number of expanded ids)
+        """
+        # Hoist everything the hot loop touches into locals
+        W = self.width
+        H = self.height
+        open_mask = self._open_mask.tolist()
+        step = _direction_steps(W)
+        h = h_table
+        size = W * H
+        n_explored = 0
+        
+        # Bucket queue for open nodes: with unit edge costs and a consistent
+        # integer heuristic, popped f values never decrease, so a cursor over
+        # per-f stacks gives O(1) push and pop. Popping the newest entry of
+        # a level first favours the children of the node just expanded, which
+        # have the lowest h at that f, approximating an (f, h) order
+        cur_f = h[start_id]
+        buckets = [[] for _ in range(cur_f + W + H + 1)]
+        buckets[cur_f].append(start_id)
+        n_open = 1
+        
+        # Cost of the best path to the end found so far
+        best_goal = _INF
+        
+        # Flat C buffers instead of NumPy arrays: indexing an array.array or
+        # bytearray from Python is a plain buffer access with no scalar boxing
+        
+        # For tracking where nodes came from (-1 marks the start)
+        came_from = array('i', [-1]) * size
+        
+        # Cost from start to each node
+        g_score = array('i', [_INF]) * size
+        g_score[start_id] = 0
+        
+        # Nodes that have already been expanded
+        closed = bytearray(size)
+        
+        while n_open:
+            # Get the node with the lowest f_score, skipping stale entries
+            # left behind when a node was pushed again with a better score
+            while not buckets[cur_f]:
+                cur_f += 1
             
-            # Add to explored nodes for visualization
-            self.explored_nodes.add(current)
+            # Nothing left can beat the best known path: the end is settled
+            if cur_f >= best_goal:
+                current = end_id
+            else:
+                current = buckets[cur_f].pop()
+                n_open -= 1
+                if closed[current]:
+                    continue
+            closed[current] = 1
+            explored[n_explored] = current
+            n_explored += 1
             
             # If we reached the goal, reconstruct and return the path
-            if current == end:
+            if current == end_id:
                 path = []
-                while current is not None:
+                while current != -1:
                     path.append(current)
                     current = came_from[current]
                 path.reverse()
-                return path
+                return path, n_explored
             
-            # Explore neighbors
-            for neighbor in self._get_neighbors(current):
-                # Calculate tentative g_score
-                tentative_g_score = g_score[current] + 1
+            tentative_g_score = g_score[current] + 1
+            
+            # Explore the open neighbors by iterating the set bits of the mask
+            m = open_mask[current]
+            while m:
+                bit = m & -m
+                m ^= bit
+                neighbor = current + step[bit]
+                if closed[neighbor]:
+                    continue
                 
                 # If we found a better path to the neighbor
-                if neighbor not in g_score or tentative_g_score < g_score[neighbor]:
+                if tentative_g_score < g_score[neighbor]:
+                    f_score = tentative_g_score + h[neighbor]
+                    if neighbor == end_id:
+                        best_goal = tentative_g_score
+                    elif f_score >= best_goal:
+                        # Cannot lead to a shorter path than the one already found
+                        continue
                     came_from[neighbor] = current
                     g_score[neighbor] = tentative_g_score
-                    f_score[neighbor] = tentative_g_score + self._heuristic(neighbor, end)
-                    
-                    if neighbor not in open_set_hash:
-                        heapq.heappush(open_set, (f_score[neighbor], neighbor))
-                        open_set_hash.add(neighbor)
+                    while f_score >= len(buckets):
+                        buckets.append([])
+                    buckets[f_score].append(neighbor)
+                    n_open += 1
         
         # No path found
-        return None
+        return None, n_explored
+        
+    def find_path_bidir(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Find the shortest path by searching from both ends at once.
+        
+        A forward search towards `end` and a backward search towards `start`
+        are expanded alternately. Whenever a relaxed cell has been reached by
+        both searches, the best meeting cost is updated; once the larger f at
+        the top of either open set cannot beat it, the path is optimal.
+        
+        Args:
+            start: Starting point coordinates (x, y)
+            end: Ending point coordinates (x, y)
+            
+        Returns:
+            List of coordinates representing the path from start to end, or None if no path exists
+        """
+        W = self.width
+        H = self.height
+        open_mask = self._open_mask.tolist()
+        step = _direction_steps(W)
+        pop = heapq.heappop
+        size = W * H
         
+        start_id = start[1] * W + start[0]
+        end_id = end[1] * W + end[0]
+        
+        # Per-direction state: index 0 searches forward, index 1 backward
+        targets = (end, start)
+        g_score = (array('i', [_INF]) * size, array('i', [_INF]) * size)
+        came_from = (array('i', [-1]) * size, array('i', [-1]) * size)
+        closed = (bytearray(size), bytearray(size))
+        open_sets = ([(0, start_id)], [(0, end_id)])
+        g_score[0][start_id] = 0
+        g_score[1][end_id] = 0
+        explored_order = []
+        
+        # Best known path cost through a meeting cell
+        mu = 0 if start_id == end_id else _INF
+        meet = start_id if start_id == end_id else -1
+        
+        side = 0
+        while open_sets[0] and open_sets[1]:
+            if max(open_sets[0][0][0], open_sets[1][0][0]) >= mu:
+                break
+            
+            open_set = open_sets[side]
+            g = g_score[side]
+            other_g = g_score[1 - side]
+            parents = came_from[side]
+            done = closed[side]
+            tx, ty = targets[side]
+            
+            _, current = pop(open_set)
+            if not done[current]:
+                done[current] = 1
+                explored_order.append(current)
+                tentative_g_score = g[current] + 1
+                pending = []
+                
+                m = open_mask[current]
+                while m:
+                    bit = m & -m
+                    m ^= bit
+                    neighbor = current + step[bit]
+                    if done[neighbor] or tentative_g_score >= g[neighbor]:
+                        continue
+                    ny, nx = divmod(neighbor, W)
+                    parents[neighbor] = current
+                    g[neighbor] = tentative_g_score
+                    pending.append((tentative_g_score + abs(nx - tx) + abs(ny - ty), neighbor))
+                    
+                    # The neighbor joins both frontiers if the other side reached it
+                    total = tentative_g_score + other_g[neighbor]
+                    if total < mu:
+                        mu = total
+                        meet = neighbor
+                if pending:
+                    _push_batch(open_set, pending)
+            
+            side = 1 - side
+        
+        self._explored_order = np.array(explored_order, dtype=np.int32)
+        self._explored_n = len(explored_order)
+        if meet == -1:
+            return None
+        
+        # Splice the forward half (start..meet) with the backward half (meet..end)
+        path_ids = []
+        current = meet
+        while current != -1:
+            path_ids.append(current)
+            current = came_from[0][current]
+        path_ids.reverse()
+        current = came_from[1][meet]
+        while current != -1:
+            path_ids.append(current)
+            current = came_from[1][current]
+        return [(cid % W, cid // W) for cid in path_ids]
+    
+    def _jump(self, x: int, y: int, dx: int, dy: int, end: Tuple[int, int],
+              side_open: np.ndarray) -> Optional[Tuple[int, int, int]]:
+        """Scan from (x, y) in direction (dx, dy) to the next jump point.
+        
+        The scan runs along the row or column until a wall blocks it. A cell
+        is a jump point if it is the end or has an opening perpendicular to
+        the scan; cells in between are corridor cells with no other choice.
+        
+        Args:
+            x, y: Cell the scan starts from
+            dx, dy: Unit direction of the scan
+            end: Target coordinates (x, y)
+            side_open: Per-cell flags for a perpendicular opening
+            
+        Returns:
+            Tuple (jx, jy, cost) of the jump point, or None for a dead end
+        """
+        if dx:
+            # Walls along the row, then the cells the scan would enter
+            blocks = self.wall_v[x:, y] if dx > 0 else self.wall_v[:x, y][::-1]
+            run = int(np.argmax(blocks)) if blocks.any() else len(blocks)
+            cells = side_open[x + 1:x + run + 1, y] if dx > 0 else side_open[x - run:x, y][::-1]
+        else:
+            blocks = self.wall_h[x, y:] if dy > 0 else self.wall_h[x, :y][::-1]
+            run = int(np.argmax(blocks)) if blocks.any() else len(blocks)
+            cells = side_open[x, y + 1:y + run + 1] if dy > 0 else side_open[x, y - run:y][::-1]
+        
+        # The end counts as a jump point if it lies within the scanned run
+        steps_to_end = abs(end[0] - x) + abs(end[1] - y)
+        if (end[1] == y if dx else end[0] == x) and 0 < steps_to_end <= run and \
+                (end[0] - x) * dx + (end[1] - y) * dy == steps_to_end:
+            cells = cells[:steps_to_end].copy()
+            cells[-1] = True
+        
+        if not cells.any():
+            return None
+        cost = int(np.argmax(cells)) + 1
+        return x + dx * cost, y + dy * cost, cost
+    
+    def find_path_jps(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Find the shortest path using Jump Point Search.
+        
+        A* runs over jump points only: from each expanded cell the search
+        scans straight through corridors with `_jump`, so symmetric runs of
+        cells are never pushed to the open set. The explored nodes are the
+        expanded jump points.
+        
+        Args:
+            start: Starting point coordinates (x, y)
+            end: Ending point coordinates (x, y)
+            
+        Returns:
+            List of coordinates representing the path from start to end, or None if no path exists
+        """
+        W = self.width
+        H = self.height
+        wh = self.wall_h
+        wv = self.wall_v
+        open_mask = self._open_mask.tolist()
+        ex, ey = end
+        pop = heapq.heappop
+        size = W * H
+        
+        # Cells with an opening across a horizontal / vertical scan
+        open_h = np.zeros((W, H), dtype=bool)
+        open_h[:, :-1] |= ~wh
+        open_h[:, 1:] |= ~wh
+        open_v = np.zeros((W, H), dtype=bool)
+        open_v[:-1, :] |= ~wv
+        open_v[1:, :] |= ~wv
+        
+        start_id = start[1] * W + start[0]
+        end_id = ey * W + ex
+        g_score = array('i', [_INF]) * size
+        came_from = array('i', [-1]) * size
+        closed = bytearray(size)
+        g_score[start_id] = 0
+        open_set = [(0, start_id)]
+        explored_order = []
+        
+        found = False
+        while open_set:
+            _, current = pop(open_set)
+            if closed[current]:
+                continue
+            closed[current] = 1
+            explored_order.append(current)
+            if current == end_id:
+                found = True
+                break
+            
+            y, x = divmod(current, W)
+            g = g_score[current]
+            pending = []
+            m = open_mask[current]
+            while m:
+                bit = m & -m
+                m ^= bit
+                dx, dy = _DIRECTION_DELTAS[bit]
+                jump = self._jump(x, y, dx, dy, end, open_h if dx else open_v)
+                if jump is None:
+                    continue
+                jx, jy, cost = jump
+                neighbor = jy * W + jx
+                tentative_g_score = g + cost
+                if closed[neighbor] or tentative_g_score >= g_score[neighbor]:
+                    continue
+                came_from[neighbor] = current
+                g_score[neighbor] = tentative_g_score
+                pending.append((tentative_g_score + abs(jx - ex) + abs(jy - ey), neighbor))
+            if pending:
+                _push_batch(open_set, pending)
+        
+        self._explored_order = np.array(explored_order, dtype=np.int32)
+        self._explored_n = len(explored_order)
+        if not found:
+            return None
+        
+        # Walk the jump points back to the start, filling in the corridor cells
+        path = [end]
+        current = end_id
+        while came_from[current] != -1:
+            parent = came_from[current]
+            px, py = parent % W, parent // W
+            cx, cy = path[-1]
+            step_x = (px > cx) - (px < cx)
+            step_y = (py > cy) - (py < cy)
+            while (cx, cy) != (px, py):
+                cx += step_x
+                cy += step_y
+                path.append((cx, cy))
+            current = parent
+        path.reverse()
+        return path
+    
+    def _explored_cells(self) -> np.ndarray:
+        """Return the explored cells as an (N, 2) array of (x, y) in expansion order."""
+        ids = self._explored_order[:self._explored_n]
+        return np.column_stack((ids % self.width, ids // self.width))
+    
     def get_explored_nodes(self) -> Set[Tuple[int, int]]:
         """Return the set of nodes that were explored during the search."""
-        return self.explored_nodes
\ No newline at end of file
+        return set(map(tuple, self._explored_cells().tolist()))
+    
+    def get_explored_order(self) -> List[Tuple[int, int]]:
+        """Return the explored nodes in the order they were expanded."""
+        return list(map(tuple, self._explored_cells().tolist()))
+
+
+class HierarchicalAStar:
+    """Hierarchical A* (HPA*) for answering many path queries on one maze.
+    
+    The maze is split into square chunks. Every open edge between two chunks
+    is a transition whose two cells become portals of an abstract graph, and
+    portals of the same chunk are joined by their in-chunk BFS distance. The
+    BFS parent trees are cached so abstract edges can be expanded back into
+    cells without searching again. A query links start and end to the
+    portals of their chunks and runs A* on the small abstract graph only.
+    
+    Since every transition is a portal and in-chunk distances are exact, the
+    returned paths are shortest paths.
+    """
+    
+    def __init__(self, width: int, height: int, walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None,
+                 wall_h: Optional[np.ndarray] = None, wall_v: Optional[np.ndarray] = None, chunk_size: int = 8):
+        """Initialize the abstract graph for a maze.
+        
+        Args:
+            width: Width of the maze in cells
+            height: Height of the maze in cells
+            walls: Set of wall tuples, used if the wall arrays are not given
+            wall_h: Optional (width, height - 1) bool array of walls below each cell
+            wall_v: Optional (width - 1, height) bool array of walls right of each cell
+            chunk_size: Side length of a chunk in cells
+        """
+        self.astar = AStar(width, height, walls, wall_h, wall_v)
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self._open_mask = self.astar._open_mask.tolist()
+        self._step = _direction_steps(width)
+        
+        # Abstract graph: portal id -> list of (portal id, cost)
+        self._graph: Dict[int, List[Tuple[int, int]]] = {}
+        # Portal ids of each chunk, keyed by (chunk x, chunk y)
+        self._chunk_portals: Dict[Tuple[int, int], Set[int]] = {}
+        # In-chunk BFS parents rooted at each portal
+        self._trees: Dict[int, Dict[int, int]] = {}
+        self._explored: List[int] = []
+        self._build()
+    
+    def _chunk_of(self, cid: int) -> Tuple[int, int]:
+        """Return the chunk containing a cell id."""
+        y, x = divmod(cid, self.width)
+        return x // self.chunk_size, y // self.chunk_size
+    
+    def _chunk_bfs(self, source: int) -> Tuple[Dict[int, int], Dict[int, int]]:
+        """Breadth-first search from a cell that never leaves its chunk.
+        
+        Returns:
+            Tuple of (distance, parent) dicts keyed by cell id; the source's parent is -1
+        """
+        W = self.width
+        cs = self.chunk_size
+        open_mask = self._open_mask
+        step = self._step
+        cx, cy = self._chunk_of(source)
+        x0, y0 = cx * cs, cy * cs
+        
+        dist = {source: 0}
+        parents = {source: -1}
+        queue = deque([source])
+        while queue:
+            current = queue.popleft()
+            m = open_mask[current]
+            while m:
+                bit = m & -m
+                m ^= bit
+                neighbor = current + step[bit]
+                if neighbor in dist:
+                    continue
+                ny, nx = divmod(neighbor, W)
+                if not (x0 <= nx < x0 + cs and y0 <= ny < y0 + cs):
+                    continue
+                dist[neighbor] = dist[current] + 1
+                parents[neighbor] = current
+                queue.append(neighbor)
+        return dist, parents
+    
+    def _build(self):
+        """Find the transitions between chunks and link portals within chunks."""
+        W = self.width
+        cs = self.chunk_size
+        graph = self._graph
+        
+        # Open edges across vertical and horizontal chunk boundaries
+        transitions = []
+        boundary_x = np.arange(cs - 1, self.width - 1, cs)
+        xs, ys = np.nonzero(~self.astar.wall_v[boundary_x, :])
+        for x, y in zip(boundary_x[xs].tolist(), ys.tolist()):
+            transitions.append((y * W + x, y * W + x + 1))
+        boundary_y = np.arange(cs - 1, self.height - 1, cs)
+        xs, ys = np.nonzero(~self.astar.wall_h[:, boundary_y])
+        for x, y in zip(xs.tolist(), boundary_y[ys].tolist()):
+            transitions.append((y * W + x, (y + 1) * W + x))
+        
+        for a, b in transitions:
+            graph.setdefault(a, []).append((b, 1))
+            graph.setdefault(b, []).append((a, 1))
+            self._chunk_portals.setdefault(self._chunk_of(a), set()).add(a)
+            self._chunk_portals.setdefault(self._chunk_of(b), set()).add(b)
+        
+        for portals in self._chunk_portals.values():
+            for portal in portals:
+                dist, parents = self._chunk_bfs(portal)
+                self._trees[portal] = parents
+                for other in portals:
+                    if other != portal and other in dist:
+                        graph[portal].append((other, dist[other]))
+    
+    @staticmethod
+    def _walk_to_root(parents: Dict[int, int], cid: int) -> List[int]:
+        """Return the cells from `cid` up to the root of a BFS parent tree."""
+        cells = []
+        while cid != -1:
+            cells.append(cid)
+            cid = parents[cid]
+        return cells
+    
+    def find_path(self, start: Tuple[int, int], end: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+        """Find the shortest path from start to end on the abstract graph.
+        
+        Args:
+            start: Starting point coordinates (x, y)
+            end: Ending point coordinates (x, y)
+            
+        Returns:
+            List of coordinates representing the path from start to end, or None if no path exists
+        """
+        W = self.width
+        ex, ey = end
+        start_id = start[1] * W + start[0]
+        end_id = ey * W + ex
+        self._explored = [start_id]
+        if start_id == end_id:
+            return [start]
+        
+        # Temporarily link start and end to the portals of their chunks
+        start_dist, start_parents = self._chunk_bfs(start_id)
+        end_dist, end_parents = self._chunk_bfs(end_id)
+        extra: Dict[int, List[Tuple[int, int]]] = {start_id: []}
+        for portal in self._chunk_portals.get(self._chunk_of(start_id), ()):
+            if portal in start_dist:
+                extra[start_id].append((portal, start_dist[portal]))
+        for portal in self._chunk_portals.get(self._chunk_of(end_id), ()):
+            if portal in end_dist:
+                extra.setdefault(portal, []).append((end_id, end_dist[portal]))
+        if end_id in start_dist:
+            extra[start_id].append((end_id, start_dist[end_id]))
+        
+        # A* over the abstract graph; edge costs vary, so use a general heap
+        graph = self._graph
+        open_set = DAryHeap()
+        open_set.push(abs(start[0] - ex) + abs(start[1] - ey), start_id)
+        g_score = {start_id: 0}
+        came_from = {start_id: -1}
+        closed = set()
+        explored = []
+        while len(open_set):
+            _, current = open_set.pop()
+            if current in closed:
+                continue
+            closed.add(current)
+            explored.append(current)
+            if current == end_id:
+                break
+            for neighbor, cost in graph.get(current, []) + extra.get(current, []):
+                tentative_g_score = g_score[current] + cost
+                if neighbor in closed or tentative_g_score >= g_score.get(neighbor, _INF):
+                    continue
+                g_score[neighbor] = tentative_g_score
+                came_from[neighbor] = current
+                ny, nx = divmod(neighbor, W)
+                open_set.push(tentative_g_score + abs(nx - ex) + abs(ny - ey), neighbor)
+        self._explored = explored
+        if end_id not in closed:
+            return None
+        
+        abstract = self._walk_to_root(came_from, end_id)
+        abstract.reverse()
+        
+        # Expand every abstract edge back into cells
+        path_ids = [start_id]
+        for a, b in zip(abstract, abstract[1:]):
+            if self._chunk_of(a) != self._chunk_of(b):
+                segment = [b]
+            elif a == start_id:
+                segment = self._walk_to_root(start_parents, b)[::-1][1:]
+            elif b == end_id:
+                segment = self._walk_to_root(end_parents, a)[1:]
+            else:
+                segment = self._walk_to_root(self._trees[a], b)[::-1][1:]
+            path_ids.extend(segment)
+        return [(cid % W, cid // W) for cid in path_ids]
+    
+    def get_explored_nodes(self) -> Set[Tuple[int, int]]:
+        """Return the abstract nodes that were expanded during the last search."""
+        W = self.width
+        return {(cid % W, cid // W) for cid in self._explored}
@@ -54,7 +54,7 @@ def main():
     
     # Find the shortest path using A*
     print(f"Finding the shortest path from {start} to {end}...")
-    a_star = AStar(args.width, args.height, walls)
+    a_star = AStar(args.width, args.height, walls, maze_generator.wall_h, maze_generator.wall_v)
     path = a_star.find_path(start, end)
     
     # Show results
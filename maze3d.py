@@ -9,19 +9,25 @@ using Panda3D engine.
 from direct.showbase.ShowBase import ShowBase
 from direct.task import Task
 from direct.gui.OnscreenText import OnscreenText
+from direct.gui.OnscreenImage import OnscreenImage
 from direct.gui.DirectGui import DirectFrame
 from panda3d.core import (
     NodePath, PandaNode, TextNode, 
     CollisionTraverser, CollisionNode, CollisionSphere, CollisionHandlerQueue,
     AmbientLight, DirectionalLight, PointLight, 
     LVector3, LPoint3, TransparencyAttrib,
-    WindowProperties, Filename, CardMaker
+    WindowProperties, Filename, CardMaker, Texture, SamplerState,
+    Geom, GeomNode, GeomTriangles, GeomVertexData, GeomVertexFormat, GeomVertexWriter,
+    OmniBoundingVolume
 )
 import sys
 import os
 from typing import List, Set, Tuple, Optional, Dict, Any
 import random
 import math
+from itertools import repeat
+
+import numpy as np
 
 # Import existing maze and A* code
 from maze_generator import MazeGenerator
@@ -31,13 +37,15 @@ from astar import AStar
 class Maze3D(ShowBase):
     """3D Maze visualization using Panda3D."""
     
-    def __init__(self, width: int = 10, height: int = 10, seed: Optional[int] = None):
+    def __init__(self, width: int = 10, height: int = 10, seed: Optional[int] = None,
+                 walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None):
         """Initialize the 3D maze.
         
         Args:
             width: Width of the maze in cells
             height: Height of the maze in cells
             seed: Optional seed for maze generation
+            walls: Optional walls of an already generated maze to show instead of generating one
         """
         # Initialize ShowBase
         ShowBase.__init__(self)
@@ -45,12 +53,18 @@ class Maze3D(ShowBase):
         # Set window properties
         self.set_window_properties()
         
+        # Load shared assets once; walls, floor and markers reuse them
+        self.wall_texture = self.loader.loadTexture("models/wall.jpg")
+        self.floor_texture = self.loader.loadTexture("models/floor.jpg")
+        self.sphere_model = self.loader.loadModel("models/misc/sphere")
+        
         # Initialize maze parameters
         self.width = width
         self.height = height
         self.seed = seed
         self.cell_size = 2.0  # Size of each cell in 3D units
         self.wall_height = 1.5  # Height of maze walls
+        self.max_camera_height = max(width, height) * self.cell_size * 1.5  # Zoom-out limit
         
         # Set up scene
         self.setup_scene()
@@ -59,7 +73,7 @@ class Maze3D(ShowBase):
         self.traverser = CollisionTraverser()
         
         # Generate the maze
-        self.generate_maze()
+        self.generate_maze(walls)
         
         # Set up the camera
         self.setup_camera()
@@ -77,6 +91,12 @@ class Maze3D(ShowBase):
         self.path = self.astar.find_path(self.start_pos, self.end_pos)
         self.explored_nodes = self.astar.get_explored_nodes()
         
+        # Path membership per cell, indexed as path_mask[x, y]
+        self.path_mask = np.zeros((self.width, self.height), dtype=bool)
+        if self.path:
+            xs, ys = zip(*self.path)
+            self.path_mask[list(xs), list(ys)] = True
+        
         # Set up UI elements
         self.setup_ui()
         
@@ -104,20 +124,30 @@ class Maze3D(ShowBase):
         floor = self.maze_node.attachNewNode(cm.generate())
         floor.setP(-90)  # Rotate to be horizontal
         floor.setPos(0, 0, 0)
-        floor.setTexture(self.loader.loadTexture("models/floor.jpg"))
+        floor.setTexture(self.floor_texture)
+        
+    def generate_maze(self, walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None):
+        """Generate the maze and create the 3D representation.
         
-    def generate_maze(self):
-        """Generate the maze and create the 3D representation."""
+        Args:
+            walls: Optional walls of an already generated maze to use instead of generating one
+        """
         # Generate maze using existing code
         self.maze_generator = MazeGenerator(self.width, self.height, seed=self.seed)
-        self.walls = self.maze_generator.generate()
+        if walls is None:
+            self.walls = self.maze_generator.generate()
+        else:
+            self.maze_generator.walls = walls
+            self.walls = self.maze_generator.walls
+        self.wall_h = self.maze_generator.wall_h
+        self.wall_v = self.maze_generator.wall_v
         
         # Set start and end positions
         self.start_pos = (0, 0)
         self.end_pos = (self.width - 1, self.height - 1)
         
         # Initialize A* pathfinding
-        self.astar = AStar(self.width, self.height, self.walls)
+        self.astar = AStar(self.width, self.height, self.walls, self.wall_h, self.wall_v)
         
         # Create 3D walls from the maze data
         self.create_walls()
@@ -131,28 +161,27 @@ class Maze3D(ShowBase):
         # Create a parent node for all walls
         self.wall_nodes = self.maze_node.attachNewNode("WallNodes")
         
-        # For all cells, create walls where needed
-        for x in range(self.width):
-            for y in range(self.height):
-                # Create all possible walls for this cell
-                self.create_cell_walls(x, y)
+        # Collect the wall segments, then emit them as a single Geom
+        self.wall_segments = []
+        self.create_inner_walls()
                 
         # Create boundary walls
         self.create_boundary_walls()
         
-    def create_cell_walls(self, x: int, y: int):
-        """Create walls for a specific cell."""
-        # Check right wall
-        if x < self.width - 1:
-            wall = tuple(sorted([(x, y), (x + 1, y)]))
-            if wall in self.walls:
-                self.create_wall(x + 1, y, "vertical")
-                
-        # Check top wall
-        if y < self.height - 1:
-            wall = tuple(sorted([(x, y), (x, y + 1)]))
-            if wall in self.walls:
-                self.create_wall(x, y + 1, "horizontal")
+        self.wall_geom_node = self.build_wall_geom(self.wall_segments)
+        walls = self.wall_nodes.attachNewNode(self.wall_geom_node)
+        walls.setTexture(self.wall_texture)
+        walls.setTwoSided(True)  # Show texture on both sides
+        
+    def create_inner_walls(self):
+        """Create the walls between cells straight from the wall arrays."""
+        # A wall right of cell (x, y) stands on the vertical line x + 1
+        xs, ys = np.nonzero(self.wall_v)
+        self.wall_segments.extend(zip((xs + 1).tolist(), ys.tolist(), repeat("vertical")))
+        
+        # A wall above cell (x, y) stands on the horizontal line y + 1
+        xs, ys = np.nonzero(self.wall_h)
+        self.wall_segments.extend(zip(xs.tolist(), (ys + 1).tolist(), repeat("horizontal")))
     
     def create_boundary_walls(self):
         """Create the boundary walls around the maze."""
@@ -164,38 +193,61 @@ class Maze3D(ShowBase):
         for x in range(self.width):
             self.create_wall(x, 0, "horizontal")
             
-        # Right boundary (if not opened by the algorithm)
+        # Right boundary (the generator never opens the outer edge)
         for y in range(self.height):
-            wall = tuple(sorted([(self.width - 1, y), (self.width, y)]))
-            if wall not in self.walls:
-                self.create_wall(self.width, y, "vertical")
+            self.create_wall(self.width, y, "vertical")
                 
-        # Top boundary (if not opened by the algorithm)
+        # Top boundary
         for x in range(self.width):
-            wall = tuple(sorted([(x, self.height - 1), (x, self.height)]))
-            if wall not in self.walls:
-                self.create_wall(x, self.height, "horizontal")
+            self.create_wall(x, self.height, "horizontal")
     
     def create_wall(self, x: float, y: float, orientation: str):
-        """Create a single wall at the specified position."""
-        # Create a wall model
-        if orientation == "vertical":
-            # Vertical wall (along y-axis)
-            cm = CardMaker(f"wall-v-{x}-{y}")
-            cm.setFrame(0, self.cell_size, 0, self.wall_height)
-            wall = self.wall_nodes.attachNewNode(cm.generate())
-            wall.setPos(x * self.cell_size, y * self.cell_size, 0)
-            wall.setH(90)  # Rotate to be vertical along Y
-        else:
-            # Horizontal wall (along x-axis)
-            cm = CardMaker(f"wall-h-{x}-{y}")
-            cm.setFrame(0, self.cell_size, 0, self.wall_height)
-            wall = self.wall_nodes.attachNewNode(cm.generate())
-            wall.setPos(x * self.cell_size, y * self.cell_size, 0)
+        """Queue a single wall at the specified position for the wall Geom."""
+        self.wall_segments.append((x, y, orientation))
+        
+    def build_wall_geom(self, segments: List[Tuple[float, float, str]]) -> GeomNode:
+        """Build one GeomNode with a textured quad for every wall segment.
+        
+        All walls share one vertex buffer and one triangle list, so the whole
+        maze is drawn with a single draw call.
+        
+        Args:
+            segments: List of (x, y, orientation) walls in cell coordinates
             
-        # Apply texture
-        wall.setTexture(self.loader.loadTexture("models/wall.jpg"))
-        wall.setTwoSided(True)  # Show texture on both sides
+        Returns:
+            GeomNode holding the walls
+        """
+        vdata = GeomVertexData("walls", GeomVertexFormat.getV3n3t2(), Geom.UHStatic)
+        vdata.uncleanSetNumRows(len(segments) * 4)
+        vertex = GeomVertexWriter(vdata, "vertex")
+        normal = GeomVertexWriter(vdata, "normal")
+        texcoord = GeomVertexWriter(vdata, "texcoord")
+        triangles = GeomTriangles(Geom.UHStatic)
+        
+        size = self.cell_size
+        top = self.wall_height
+        for i, (x, y, orientation) in enumerate(segments):
+            x0, y0 = x * size, y * size
+            if orientation == "vertical":
+                # Vertical wall (along y-axis)
+                x1, y1, nx, ny = x0, y0 + size, 1, 0
+            else:
+                # Horizontal wall (along x-axis)
+                x1, y1, nx, ny = x0 + size, y0, 0, -1
+            for vx, vy, vz, u, v in ((x0, y0, 0, 0, 0), (x1, y1, 0, 1, 0), (x1, y1, top, 1, 1), (x0, y0, top, 0, 1)):
+                vertex.addData3(vx, vy, vz)
+                normal.addData3(nx, ny, 0)
+                texcoord.addData2(u, v)
+            base = i * 4
+            triangles.addVertices(base, base + 1, base + 2)
+            triangles.addVertices(base, base + 2, base + 3)
+        
+        geom = Geom(vdata)
+        geom.addPrimitive(triangles)
+        geom.setBounds(OmniBoundingVolume())
+        node = GeomNode("walls")
+        node.addGeom(geom)
+        return node
         
     def setup_camera(self):
         """Set up the camera for the 3D view."""
@@ -244,7 +296,7 @@ class Maze3D(ShowBase):
     def setup_player(self):
         """Set up the player object."""
         # Create a simple sphere for the player
-        self.player = self.loader.loadModel("models/misc/sphere")
+        self.player = self.sphere_model.copyTo(self.render)
         self.player.setColor(0, 0.8, 0, 1)  # Green
         self.player.setScale(0.3)
         self.player.setPos(
@@ -252,15 +304,16 @@ class Maze3D(ShowBase):
             self.start_pos[1] * self.cell_size + self.cell_size/2,
             0.3
         )
-        self.player.reparentTo(self.render)
         
-        # Update player light position
+        # Place the player light above the player and attach it, so it
+        # follows the player through the scene graph without per-frame work
         self.plnp.setPos(self.player.getPos() + LVector3(0, 0, 1))
+        self.plnp.wrtReparentTo(self.player)
         
     def setup_goal(self):
         """Set up the goal object."""
         # Create a simple cube for the goal
-        self.goal = self.loader.loadModel("models/misc/sphere")
+        self.goal = self.sphere_model.copyTo(self.render)
         self.goal.setColor(0.8, 0, 0, 1)  # Red
         self.goal.setScale(0.3)
         self.goal.setPos(
@@ -268,7 +321,6 @@ class Maze3D(ShowBase):
             self.end_pos[1] * self.cell_size + self.cell_size/2,
             0.3
         )
-        self.goal.reparentTo(self.render)
         
         # Add a point light at the goal
         glight = PointLight('glight')
@@ -293,6 +345,20 @@ class Maze3D(ShowBase):
         self.minimap_frame.setDepthTest(False)
         self.minimap_frame.setDepthWrite(False)
         
+        # The minimap is painted into a pixel buffer that is uploaded to one texture
+        self.minimap_cell_px = max(2, 256 // max(self.width, self.height))
+        texture_size = self.minimap_cell_px * max(self.width, self.height) + 1
+        self.minimap_pixels = np.zeros((texture_size, texture_size, 4), dtype=np.uint8)
+        self.minimap_tex = Texture("minimap")
+        self.minimap_tex.setup2dTexture(texture_size, texture_size, Texture.TUnsignedByte, Texture.FRgba)
+        self.minimap_tex.setMagfilter(SamplerState.FTNearest)
+        self.minimap_tex.setMinfilter(SamplerState.FTNearest)
+        self.minimap_image = OnscreenImage(image=self.minimap_tex, parent=self.minimap_frame, scale=minimap_size)
+        self.minimap_image.setTransparency(TransparencyAttrib.MAlpha)
+        self.minimap_image.setBin('fixed', 1)  # Make sure content renders on top
+        self.minimap_image.setDepthTest(False)
+        self.minimap_image.setDepthWrite(False)
+        
         # Instructions text
         self.instructions = OnscreenText(
             text="WASD: Move | Q/E: Rotate | Z/X: Zoom In/Out | R: Reset | P: Path | ESC: Quit",
@@ -302,173 +368,87 @@ class Maze3D(ShowBase):
             mayChange=False
         )
         
-        # Counter to limit minimap updates (every 15 frames)
-        self.minimap_update_counter = 0
-        
-        # Update minimap
+        # Paint the static minimap layer once
         self.update_minimap()
         
-    def update_minimap(self):
-        """Update the minimap display."""
-        # Remove existing minimap content if any
-        if hasattr(self, 'minimap_content') and self.minimap_content is not None:
-            self.minimap_content.removeNode()
-            
-        # Create a parent node for minimap content
-        self.minimap_content = self.minimap_frame.attachNewNode("MinimapContent")
-        self.minimap_content.setBin('fixed', 1)  # Make sure content renders on top
-        self.minimap_content.setDepthTest(False)
-        self.minimap_content.setDepthWrite(False)
-        
-        minimap_size = 0.3  # Same as frame size
-        
-        # Calculate cell size in minimap
-        cell_size_ratio = minimap_size * 2 / max(self.width, self.height)
-        
-        # Create cells for each maze position
-        for x in range(self.width):
-            for y in range(self.height):
-                # Calculate position in minimap space (-1 to 1)
-                pos_x = -minimap_size + (x + 0.5) * cell_size_ratio
-                pos_y = -minimap_size + (y + 0.5) * cell_size_ratio
-                
-                # Create a rectangle for this cell
-                cm = CardMaker(f"cell-{x}-{y}")
-                cm.setFrame(
-                    pos_x - cell_size_ratio * 0.4, 
-                    pos_x + cell_size_ratio * 0.4,
-                    pos_y - cell_size_ratio * 0.4, 
-                    pos_y + cell_size_ratio * 0.4
-                )
-                cell = self.minimap_content.attachNewNode(cm.generate())
-                cell.setBin('fixed', 1)  # Set render order
-                
-                # Color cells (dark gray for normal, light for path)
-                is_in_path = (x, y) in self.path
-                cell.setColor(
-                    0.7 if is_in_path else 0.3,  # R
-                    0.7 if is_in_path else 0.3,  # G
-                    0.7 if is_in_path else 0.3,  # B
-                    1.0  # A
-                )
-        
-        # Add walls to minimap
-        for x in range(self.width):
-            for y in range(self.height):
-                # Calculate position in minimap space (-1 to 1)
-                pos_x = -minimap_size + x * cell_size_ratio
-                pos_y = -minimap_size + y * cell_size_ratio
-                
-                # Check right wall
-                if x < self.width - 1:
-                    wall = tuple(sorted([(x, y), (x + 1, y)]))
-                    if wall in self.walls:
-                        # Create vertical wall line
-                        cm = CardMaker(f"wall-v-{x}-{y}")
-                        wall_x = pos_x + cell_size_ratio
-                        cm.setFrame(
-                            wall_x - cell_size_ratio * 0.05, 
-                            wall_x + cell_size_ratio * 0.05,
-                            pos_y, 
-                            pos_y + cell_size_ratio
-                        )
-                        wall = self.minimap_content.attachNewNode(cm.generate())
-                        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-                
-                # Check top wall
-                if y < self.height - 1:
-                    wall = tuple(sorted([(x, y), (x, y + 1)]))
-                    if wall in self.walls:
-                        # Create horizontal wall line
-                        cm = CardMaker(f"wall-h-{x}-{y}")
-                        wall_y = pos_y + cell_size_ratio
-                        cm.setFrame(
-                            pos_x, 
-                            pos_x + cell_size_ratio,
-                            wall_y - cell_size_ratio * 0.05, 
-                            wall_y + cell_size_ratio * 0.05
-                        )
-                        wall = self.minimap_content.attachNewNode(cm.generate())
-                        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-        
-        # Draw boundary walls
-        # Left boundary
-        cm = CardMaker("left-boundary")
-        cm.setFrame(
-            -minimap_size - cell_size_ratio * 0.05, 
-            -minimap_size + cell_size_ratio * 0.05,
-            -minimap_size, 
-            -minimap_size + cell_size_ratio * self.height
-        )
-        wall = self.minimap_content.attachNewNode(cm.generate())
-        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-        
-        # Bottom boundary
-        cm = CardMaker("bottom-boundary")
-        cm.setFrame(
-            -minimap_size, 
-            -minimap_size + cell_size_ratio * self.width,
-            -minimap_size - cell_size_ratio * 0.05, 
-            -minimap_size + cell_size_ratio * 0.05
-        )
-        wall = self.minimap_content.attachNewNode(cm.generate())
-        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-        
-        # Right boundary
-        cm = CardMaker("right-boundary")
-        cm.setFrame(
-            -minimap_size + cell_size_ratio * self.width - cell_size_ratio * 0.05, 
-            -minimap_size + cell_size_ratio * self.width + cell_size_ratio * 0.05,
-            -minimap_size, 
-            -minimap_size + cell_size_ratio * self.height
-        )
-        wall = self.minimap_content.attachNewNode(cm.generate())
-        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-        
-        # Top boundary
-        cm = CardMaker("top-boundary")
-        cm.setFrame(
-            -minimap_size, 
-            -minimap_size + cell_size_ratio * self.width,
-            -minimap_size + cell_size_ratio * self.height - cell_size_ratio * 0.05, 
-            -minimap_size + cell_size_ratio * self.height + cell_size_ratio * 0.05
-        )
-        wall = self.minimap_content.attachNewNode(cm.generate())
-        wall.setColor(0.8, 0.4, 0.2, 1)  # Brown wall
-        
-        # Add player indicator (green dot)
-        player_x = -minimap_size + (self.player.getX() / self.cell_size) * cell_size_ratio
-        player_y = -minimap_size + (self.player.getY() / self.cell_size) * cell_size_ratio
-        
+        # The player dot is the only dynamic part: a small card that is moved
+        # when the player enters another cell
+        dot_half = (max(1, int(self.minimap_cell_px * 0.2)) + 0.5) * minimap_size * 2 / texture_size
         cm = CardMaker("player-indicator")
-        cm.setFrame(
-            player_x - cell_size_ratio * 0.2, 
-            player_x + cell_size_ratio * 0.2,
-            player_y - cell_size_ratio * 0.2, 
-            player_y + cell_size_ratio * 0.2
-        )
-        player_indicator = self.minimap_content.attachNewNode(cm.generate())
-        player_indicator.setColor(0, 1, 0, 1)  # Bright green
+        cm.setFrame(-dot_half, dot_half, -dot_half, dot_half)
+        self.player_dot = self.minimap_frame.attachNewNode(cm.generate())
+        self.player_dot.setColor(0, 1, 0, 1)  # Bright green
+        self.player_dot.setBin('fixed', 2)
+        self.player_dot.setDepthTest(False)
+        self.player_dot.setDepthWrite(False)
+        self.last_player_cell = None
+        self.update_player_dot()
+        
+    def update_minimap(self):
+        """Paint the static minimap layer (cells, walls, goal) and upload it to the texture."""
+        pixels = self.minimap_pixels
+        c = self.minimap_cell_px
+        inset = max(1, c // 10)  # Gap around each cell
+        thickness = max(1, c // 10)  # Wall line width
+        wall_color = (204, 102, 51, 255)  # Brown wall
+        
+        # Rows run bottom-up, matching the maze's y axis
+        pixels[:] = 0
+        
+        # Fill each maze cell (dark gray for normal, light for path); the
+        # maze area viewed as (row, row pixel, column, column pixel) blocks
+        # lets one broadcast store paint every cell's interior
+        cell_colors = np.where(self.path_mask.T[:, :, None],
+                               np.array([178, 178, 178, 255], dtype=np.uint8),
+                               np.array([76, 76, 76, 255], dtype=np.uint8))
+        blocks = pixels[:self.height * c, :self.width * c].reshape(self.height, c, self.width, c, 4)
+        blocks[:, inset:c - inset + 1, :, inset:c - inset + 1] = cell_colors[:, None, :, None, :]
+        
+        # Add walls to minimap: each wall covers c + 1 pixels along the cell
+        # edge and 2 * thickness - 1 pixels across it
+        along = np.arange(c + 1)
+        across = np.arange(1 - thickness, thickness)
+        xs, ys = np.nonzero(self.wall_v)
+        rows = (ys * c)[:, None] + along
+        cols = ((xs + 1) * c)[:, None] + across
+        pixels[rows[:, :, None], cols[:, None, :]] = wall_color
+        xs, ys = np.nonzero(self.wall_h)
+        rows = ((ys + 1) * c)[:, None] + across
+        cols = (xs * c)[:, None] + along
+        pixels[rows[:, :, None], cols[:, None, :]] = wall_color
+        
+        # Draw boundary walls (left, bottom, right, top)
+        maze_right = self.width * c
+        maze_top = self.height * c
+        pixels[:maze_top + 1, :thickness] = wall_color
+        pixels[:thickness, :maze_right + 1] = wall_color
+        pixels[:maze_top + 1, maze_right - thickness + 1:maze_right + 1] = wall_color
+        pixels[maze_top - thickness + 1:maze_top + 1, :maze_right + 1] = wall_color
         
         # Add goal indicator (red dot)
-        goal_x = -minimap_size + (self.goal.getX() / self.cell_size) * cell_size_ratio
-        goal_y = -minimap_size + (self.goal.getY() / self.cell_size) * cell_size_ratio
-        
-        cm = CardMaker("goal-indicator")
-        cm.setFrame(
-            goal_x - cell_size_ratio * 0.2, 
-            goal_x + cell_size_ratio * 0.2,
-            goal_y - cell_size_ratio * 0.2, 
-            goal_y + cell_size_ratio * 0.2
+        radius = max(1, int(c * 0.2))
+        goal_x = int(self.goal.getX() / self.cell_size * c)
+        goal_y = int(self.goal.getY() / self.cell_size * c)
+        pixels[max(0, goal_y - radius):goal_y + radius + 1, max(0, goal_x - radius):goal_x + radius + 1] = (255, 0, 0, 255)
+        
+        self.minimap_tex.setRamImageAs(pixels.tobytes(), "RGBA")
+        
+    def update_player_dot(self):
+        """Move the minimap player dot to the center of the player's current cell."""
+        cell = (int(self.player.getX() / self.cell_size), int(self.player.getY() / self.cell_size))
+        if cell == self.last_player_cell:
+            return
+        self.last_player_cell = cell
+        
+        # Cell centers in texture pixels, mapped onto the minimap's [-0.3, 0.3] square
+        minimap_size = 0.3
+        c = self.minimap_cell_px
+        scale = minimap_size * 2 / len(self.minimap_pixels)
+        self.player_dot.setPos(
+            -minimap_size + (cell[0] * c + c // 2 + 0.5) * scale,
+            0,
+            -minimap_size + (cell[1] * c + c // 2 + 0.5) * scale
         )
-        goal_indicator = self.minimap_content.attachNewNode(cm.generate())
-        goal_indicator.setColor(1, 0, 0, 1)  # Bright red
-        
-        # Ensure all minimap elements have proper z-ordering
-        for np in self.minimap_content.findAllMatches('*'):
-            np.setBin('fixed', 1)
-            np.setDepthTest(False)
-            np.setDepthWrite(False)
             
     def setup_controls(self):
         """Set up keyboard controls."""
@@ -527,9 +507,11 @@ class Maze3D(ShowBase):
             self.path_nodes = self.render.attachNewNode("PathNodes")
             
             # Visualize the path
+            markers = self.path_nodes.attachNewNode("PathMarkers")
             for i, (x, y) in enumerate(self.path):
-                # Create a marker for each step in the path
-                path_marker = self.loader.loadModel("models/misc/sphere")
+                # Create a marker for each step in the path from the shared sphere
+                path_marker = markers.attachNewNode(f"path-{i}")
+                self.sphere_model.copyTo(path_marker)
                 path_marker.setScale(0.15)  # Make it smaller than player/goal
                 
                 # Color gradient from green (start) to red (end)
@@ -542,7 +524,10 @@ class Maze3D(ShowBase):
                     y * self.cell_size + self.cell_size/2,
                     0.2  # Just above the floor
                 )
-                path_marker.reparentTo(self.path_nodes)
+            
+            # Bake transforms and colors into one Geom so the markers are one draw call
+            markers.clearModelNodes()
+            markers.flattenStrong()
             
             # Add a light to make the path glow
             plight = PointLight('pathlight')
@@ -561,64 +546,50 @@ class Maze3D(ShowBase):
         # Handle keyboard input
         self.handle_movement()
         
-        # Update player light position
-        self.plnp.setPos(self.player.getPos() + LVector3(0, 0, 1))
-        
-        # Update the minimap less frequently to improve performance
-        self.minimap_update_counter += 1
-        if self.minimap_update_counter >= 15:  # Update every 15 frames
-            self.update_minimap()
-            self.minimap_update_counter = 0
+        # Only the player dot can change on the minimap
+        self.update_player_dot()
         
         return Task.cont
         
     def handle_movement(self):
         """Handle player movement based on keyboard input."""
-        # Get camera direction for relative movement
-        heading = self.camera.getH() * math.pi / 180  # Convert to radians
+        keys = self.keyMap
+        
+        # Get camera direction for relative movement, one sin/cos per frame
+        h = self.camera.getH()
+        heading = h * math.pi / 180  # Convert to radians
+        sin_h = math.sin(heading)
+        cos_h = math.cos(heading)
         
-        # Calculate movement direction
+        # Opposite keys cancel out: +1 forward / right, -1 backward / left
         move_speed = 0.1
-        move_x = 0
-        move_y = 0
-        
-        if self.keyMap["forward"]:
-            move_x += -math.sin(heading) * move_speed
-            move_y += -math.cos(heading) * move_speed
-        if self.keyMap["backward"]:
-            move_x += math.sin(heading) * move_speed
-            move_y += math.cos(heading) * move_speed
-        if self.keyMap["left"]:
-            move_x += -math.cos(heading) * move_speed
-            move_y += math.sin(heading) * move_speed
-        if self.keyMap["right"]:
-            move_x += math.cos(heading) * move_speed
-            move_y += -math.sin(heading) * move_speed
+        forward = keys["forward"] - keys["backward"]
+        strafe = keys["right"] - keys["left"]
+        move_x = (-sin_h * forward + cos_h * strafe) * move_speed
+        move_y = (-cos_h * forward - sin_h * strafe) * move_speed
             
-        # Apply movement
-        self.camera.setPos(
-            self.camera.getX() + move_x,
-            self.camera.getY() + move_y,
-            self.camera.getZ()
-        )
-        
         # Handle rotation
-        if self.keyMap["rotate-left"]:
-            self.camera.setH(self.camera.getH() + 1)
-        if self.keyMap["rotate-right"]:
-            self.camera.setH(self.camera.getH() - 1)
+        turn = keys["rotate-left"] - keys["rotate-right"]
+        if turn:
+            self.camera.setH(h + turn)
         
         # Handle zoom with a smooth rate and bounds
         zoom_speed = 0.1
         min_height = 1.0  # Don't go below this height
-        max_height = max(self.width, self.height) * self.cell_size * 1.5  # Don't go too high
-        
-        if self.keyMap["zoom-in"]:
-            new_z = max(self.camera.getZ() - zoom_speed, min_height)
-            self.camera.setZ(new_z)
-        if self.keyMap["zoom-out"]:
-            new_z = min(self.camera.getZ() + zoom_speed, max_height)
-            self.camera.setZ(new_z)
+        zoom_in = keys["zoom-in"]
+        zoom_out = keys["zoom-out"]
+        
+        # Apply movement and zoom with one position read and one write
+        if forward or strafe or zoom_in or zoom_out:
+            pos = self.camera.getPos()
+            pos.x += move_x
+            pos.y += move_y
+            # Zoom in, then out, each clamped on its own
+            if zoom_in:
+                pos.z = max(pos.z - zoom_speed, min_height)
+            if zoom_out:
+                pos.z = min(pos.z + zoom_speed, self.max_camera_height)
+            self.camera.setPos(pos)
         
 
 def run_maze3d(width: int = 10, height: int = 10, seed: Optional[int] = None):
@@ -1,6 +1,55 @@
 import random
 from typing import List, Tuple, Set, Optional
 
+import numpy as np
+
+from astar import NUMBA_AVAILABLE, njit, walls_to_arrays
+
+
+@njit(cache=True)
+def _carve_paths_nb(wall_h, wall_v, visited, width, height, start_x, start_y, orders):
+    """Compiled iterative DFS carver working on the wall arrays in place.
+    
+    The stack stores cell ids (y * width + x), the visit number of each
+    cell and the index of the next direction to try. The k-th visited cell
+    tries its directions in the order given by `orders[k]`.
+    """
+    dxs = np.array([1, 0, -1, 0])
+    dys = np.array([0, 1, 0, -1])
+    size = width * height
+    stack_cell = np.empty(size, dtype=np.int32)
+    stack_visit = np.empty(size, dtype=np.int32)
+    stack_next = np.zeros(size, dtype=np.int8)
+    
+    visited[start_x, start_y] = 1
+    stack_cell[0] = start_y * width + start_x
+    stack_visit[0] = 0
+    n_visited = 1
+    top = 0
+    while top >= 0:
+        i = stack_next[top]
+        if i == 4:
+            top -= 1
+            continue
+        stack_next[top] = i + 1
+        
+        x = stack_cell[top] % width
+        y = stack_cell[top] // width
+        d = orders[stack_visit[top], i]
+        nx = x + dxs[d]
+        ny = y + dys[d]
+        if 0 <= nx < width and 0 <= ny < height and visited[nx, ny] == 0:
+            if dxs[d] != 0:
+                wall_v[min(x, nx), y] = False
+            else:
+                wall_h[x, min(y, ny)] = False
+            visited[nx, ny] = 1
+            top += 1
+            stack_cell[top] = ny * width + nx
+            stack_visit[top] = n_visited
+            stack_next[top] = 0
+            n_visited += 1
+
 
 class MazeGenerator:
     def __init__(self, width: int, height: int, seed: Optional[int] = None):
@@ -14,10 +63,43 @@ class MazeGenerator:
         self.width = width
         self.height = height
         self.seed = seed
-        # Maze walls represented as a set of wall coordinates
-        self.walls = set()
-        # Visited cells during maze generation
-        self.visited = set()
+        # Walls stored as edge arrays: wall_h[x, y] separates (x, y) from
+        # (x, y + 1), wall_v[x, y] separates (x, y) from (x + 1, y)
+        self.wall_h = np.zeros((width, max(height - 1, 0)), dtype=bool)
+        self.wall_v = np.zeros((max(width - 1, 0), height), dtype=bool)
+        # Wall set derived from the arrays, built on first access
+        self._walls = None
+        # Visited cells during maze generation, indexed as visited[x, y]
+        self.visited = np.zeros((width, height), dtype=np.uint8)
+        
+    def reset(self, seed: Optional[int] = None):
+        """Set the seed for the next maze, keeping the allocated arrays.
+        
+        Args:
+            seed: Optional seed for the random number generator for reproducible mazes
+        """
+        self.seed = seed
+        self._walls = None
+        
+    @property
+    def walls(self) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
+        """Set of wall tuples built from the wall arrays on demand.
+        
+        Each wall is a tuple of two cells in sorted order. The set is cached
+        until the maze is regenerated; editing it does not change the arrays.
+        """
+        if self._walls is None:
+            xs, ys = np.nonzero(self.wall_v)
+            walls = {((x, y), (x + 1, y)) for x, y in zip(xs.tolist(), ys.tolist())}
+            xs, ys = np.nonzero(self.wall_h)
+            walls.update(((x, y), (x, y + 1)) for x, y in zip(xs.tolist(), ys.tolist()))
+            self._walls = walls
+        return self._walls
+    
+    @walls.setter
+    def walls(self, walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]]):
+        self.wall_h, self.wall_v = walls_to_arrays(self.width, self.height, walls)
+        self._walls = None
         
     def generate(self) -> Set[Tuple[Tuple[int, int], Tuple[int, int]]]:
         """Generate a random maze using depth-first search with backtracking.
@@ -26,24 +108,24 @@ class MazeGenerator:
             Set of wall tuples. Each wall is represented as a tuple of two cells.
             A wall between (0,0) and (1,0) would be ((0,0), (1,0)).
         """
-        # Reset state
-        self.walls = set()
-        self.visited = set()
+        # Reset state with every wall in place, reusing the arrays
+        self.visited.fill(0)
+        self.wall_h.fill(True)
+        self.wall_v.fill(True)
+        self._walls = None
         
         # Set the random seed if provided
         if self.seed is not None:
             random.seed(self.seed)
         
-        # Initialize all walls
-        for x in range(self.width):
-            for y in range(self.height):
-                if x < self.width - 1:
-                    self.walls.add(((x, y), (x + 1, y)))
-                if y < self.height - 1:
-                    self.walls.add(((x, y), (x, y + 1)))
-        
-        # Start from the top-left corner
-        self._carve_paths((0, 0))
+        # Start from the top-left corner; the compiled carver gets its
+        # direction orders from the (possibly seeded) random module, so both
+        # backends carve the same maze for a seed
+        if NUMBA_AVAILABLE:
+            _carve_paths_nb(self.wall_h, self.wall_v, self.visited,
+                            self.width, self.height, 0, 0, self._direction_orders())
+        else:
+            self._carve_paths((0, 0))
         
         # Reset the random seed to avoid affecting other random processes
         if self.seed is not None:
@@ -51,35 +133,82 @@ class MazeGenerator:
             
         return self.walls
     
+    def _direction_orders(self) -> np.ndarray:
+        """Draw the shuffled direction order of every cell from `random`.
+        
+        Every cell is visited exactly once, and `_carve_paths` shuffles a
+        fresh [0, 1, 2, 3] each time it visits one. Row k is that same
+        shuffle for the k-th visited cell, so the compiled carver consumes
+        the random stream exactly like the pure-Python one.
+        
+        Returns:
+            int8 array of shape (width * height, 4)
+        """
+        shuffle = random.shuffle
+        orders = []
+        for _ in range(self.width * self.height):
+            order = [0, 1, 2, 3]
+            shuffle(order)
+            orders.append(order)
+        return np.array(orders, dtype=np.int8).reshape(-1, 4)
+    
     def _carve_paths(self, cell: Tuple[int, int]):
-        """Carve paths through the maze using recursive DFS."""
-        self.visited.add(cell)
+        """Carve paths through the maze using iterative DFS with backtracking.
+        
+        Each stack entry holds a cell, its shuffled direction order and the
+        index of the next direction to try, so backtracking resumes exactly
+        where the recursive version would have.
+        """
+        visited = self.visited
+        wall_h = self.wall_h
+        wall_v = self.wall_v
         
         # Define possible directions to move (right, down, left, up)
         directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-        random.shuffle(directions)
         
-        # Try each direction
-        for dx, dy in directions:
-            next_cell = (cell[0] + dx, cell[1] + dy)
+        visited[cell] = 1
+        order = [0, 1, 2, 3]
+        random.shuffle(order)
+        stack = [[cell[0], cell[1], order, 0]]
+        while stack:
+            top = stack[-1]
+            x, y, order, i = top
+            if i == 4:
+                stack.pop()
+                continue
+            top[3] = i + 1
+            
+            dx, dy = directions[order[i]]
+            nx, ny = x + dx, y + dy
             
             # Check if the next cell is valid and not visited
-            if (0 <= next_cell[0] < self.width and 
-                0 <= next_cell[1] < self.height and 
-                next_cell not in self.visited):
-                
+            if 0 <= nx < self.width and 0 <= ny < self.height and not visited[nx, ny]:
                 # Remove the wall between the current and next cell
-                wall = tuple(sorted([cell, next_cell]))
-                if wall in self.walls:
-                    self.walls.remove(wall)
+                if dx:
+                    wall_v[min(x, nx), y] = False
+                else:
+                    wall_h[x, min(y, ny)] = False
                 
                 # Continue carving from the next cell
-                self._carve_paths(next_cell)
+                visited[nx, ny] = 1
+                order = [0, 1, 2, 3]
+                random.shuffle(order)
+                stack.append([nx, ny, order, 0])
     
     def is_wall_between(self, cell1: Tuple[int, int], cell2: Tuple[int, int]) -> bool:
         """Check if there's a wall between two adjacent cells."""
-        if (abs(cell1[0] - cell2[0]) + abs(cell1[1] - cell2[1])) != 1:
-            raise ValueError("Cells must be adjacent")
+        dx = cell2[0] - cell1[0]
+        dy = cell2[1] - cell1[1]
+        
+        # Index the edge by its left or upper cell; edges leading out of the
+        # maze have no wall entry (and must not wrap around on negative indices)
+        if dy == 0 and dx in (1, -1):
+            x = min(cell1[0], cell2[0])
+            y = cell1[1]
+            return 0 <= x < self.width - 1 and 0 <= y < self.height and bool(self.wall_v[x, y])
+        elif dx == 0 and dy in (1, -1):
+            x = cell1[0]
+            y = min(cell1[1], cell2[1])
+            return 0 <= x < self.width and 0 <= y < self.height - 1 and bool(self.wall_h[x, y])
         
-        wall = tuple(sorted([cell1, cell2]))
-        return wall in self.walls
\ No newline at end of file
+        raise ValueError("Cells must be adjacent")
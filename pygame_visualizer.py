@@ -8,6 +8,8 @@ import pygame
 import sys
 from typing import List, Set, Tuple, Optional, Dict, Any
 import time
+import numpy as np
+from itertools import repeat
 from maze_generator import MazeGenerator
 from astar import AStar
 
@@ -25,9 +27,47 @@ GRAY = (200, 200, 200)
 DARK_BLUE = (0, 0, 139)
 ORANGE = (255, 165, 0)
 
+# Control panel entries as (text, is_header)
+CONTROLS = [
+    ("Controls:", True),  # Section header
+    ("R: Regenerate maze", False),
+    ("S: Set start position (click)", False),
+    ("E: Set end position (click)", False),
+    ("A: Toggle animation", False),
+    ("Space: Find path", False),
+    ("D: Set seed for debugging", False),
+    ("Q: Quit", False)
+]
+
+# Help lines shown in the seed input box
+SEED_INSTRUCTIONS = [
+    "Type a number to set a specific seed",
+    "Press Enter to confirm",
+    "Press Esc to cancel"
+]
+
+# Minimum time between display updates while animating, one frame at 60 FPS
+ANIMATION_FRAME_MS = 16
+
+# Main loop rates while animating or selecting, and while idle
+ACTIVE_FPS = 60
+IDLE_FPS = 30
+
+# Events after which run() has to redraw the frame
+REDRAW_EVENTS = (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED)
+
+# Legend entries as (color, text)
+LEGENDS = [
+    (GREEN, "Start position"),
+    (RED, "End position"),
+    (YELLOW, "Path"),
+    (MAGENTA, "Explored nodes")
+]
+
 
 class PygameMazeVisualizer:
-    def __init__(self, width: int, height: int, cell_size: int = 40, margin: int = 50, seed: Optional[int] = None):
+    def __init__(self, width: int, height: int, cell_size: int = 40, margin: int = 50, seed: Optional[int] = None,
+                 walls: Optional[Set[Tuple[Tuple[int, int], Tuple[int, int]]]] = None):
         """Initialize the Pygame maze visualizer.
         
         Args:
@@ -36,6 +76,8 @@ class PygameMazeVisualizer:
             cell_size: Size of each cell in pixels
             margin: Margin around the maze in pixels
             seed: Optional seed for maze generation
+            walls: Optional walls of an already generated first maze; later
+                regenerations still use the generator
         """
         # Initialize maze parameters
         self.width = width
@@ -54,15 +96,52 @@ class PygameMazeVisualizer:
         # Calculate screen dimensions with extra width for controls
         self.screen_width = self.control_panel_width + width * cell_size + 2 * margin
         self.screen_height = height * cell_size + 2 * margin
-        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height))
+        # Let SDL scale through its renderer and present from a back buffer
+        self.screen = pygame.display.set_mode((self.screen_width, self.screen_height),
+                                              pygame.SCALED | pygame.DOUBLEBUF)
+        
+        # Cached background holding everything that only changes on regeneration
+        self._static_bg = pygame.Surface((self.screen_width, self.screen_height)).convert()
+        self._control_panel_surf = pygame.Surface((self.control_panel_width, self.screen_height)).convert()
+        
+        # Pre-filled cell tiles so each layer is drawn with a single blits() call
+        self._explored_tile = self._make_tile(cell_size - 6, MAGENTA)
+        self._path_tile = self._make_tile(cell_size - 10, YELLOW)
+        self._start_tile = self._make_tile(cell_size - 10, GREEN)
+        self._end_tile = self._make_tile(cell_size - 10, RED)
+        
+        # Semi-transparent backdrop of the seed input box
+        self._seed_overlay = pygame.Surface((self.control_panel_width - 20, 150), pygame.SRCALPHA).convert_alpha()
+        self._seed_overlay.fill((200, 225, 255, 240))  # Light blue with some transparency
+        
+        # Top-left pixel of cell (0, 0), since the layout never changes
+        self._grid_origin = np.array([self.control_panel_width + self.margin, self.margin], dtype=np.intp)
         
-        # Set up font
+        # Blit sequences of the explored and path layers, with the cells they were built from
+        self._blit_cache: Dict[str, Tuple[Any, int, List]] = {}
+        
+        # Set up fonts once, SysFont does a font lookup on every call
         self.font = pygame.font.SysFont('Arial', 16)
+        self.title_font = pygame.font.SysFont('Arial', 20, bold=True)
+        self.header_font = pygame.font.SysFont('Arial', 18, bold=True)
+        
+        # Pre-rendered surfaces for labels whose text never changes
+        self._label_surfs = self._render_labels()
+        
+        # Seed input cursor, and the typed text with the string it was rendered from
+        self._cursor_surf = self.font.render("|", True, BLACK).convert_alpha()
+        self._seed_text = (None, None)
         
         # Initialize maze components
         self.maze_generator = MazeGenerator(width, height, seed=self.seed)
-        self.walls = self.maze_generator.generate()
-        self.astar = AStar(width, height, self.walls)
+        if walls is None:
+            self.walls = self.maze_generator.generate()
+        else:
+            self.maze_generator.walls = walls
+            self.walls = self.maze_generator.walls
+        self._wall_right = self.maze_generator.wall_v
+        self._wall_down = self.maze_generator.wall_h
+        self.astar = AStar(width, height, self.walls, self._wall_down, self._wall_right)
         
         # Set initial start and end positions
         self.start_pos = (0, 0)
@@ -81,6 +160,12 @@ class PygameMazeVisualizer:
         self.selecting_start = False
         self.selecting_end = False
         
+        # Redraw flag, cleared by run() after each presented frame
+        self._dirty = True
+        
+        # Start/end pair waiting for a path search, set by clicks
+        self._pending_query = None
+        
         # Seed input variables
         self.entering_seed = False
         self.seed_input = "" if self.seed is None else str(self.seed)
@@ -91,6 +176,62 @@ class PygameMazeVisualizer:
         self.path = self.astar.find_path(self.start_pos, self.end_pos)
         self.explored_nodes = self.astar.get_explored_nodes()
         
+        self._build_wall_segments()
+        self._render_static()
+        self._render_control_panel()
+        
+    @staticmethod
+    def _make_tile(size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Create a square surface filled with a single color."""
+        tile = pygame.Surface((max(size, 0), max(size, 0))).convert()
+        tile.fill(color)
+        return tile
+    
+    def _render_labels(self) -> Dict[str, pygame.Surface]:
+        """Render every fixed panel label once.
+        
+        Returns:
+            Dictionary mapping label text to its rendered surface
+        """
+        labels = {"A* Maze Visualization": self.title_font.render("A* Maze Visualization", True, BLACK)}
+        for text in ("Legend:", "Debugging Info:", "Enter Seed Value:"):
+            labels[text] = self.header_font.render(text, True, BLACK)
+        for text, is_header in CONTROLS:
+            labels[text] = (self.header_font if is_header else self.font).render(text, True, BLACK)
+        for text in [label for _, label in LEGENDS] + SEED_INSTRUCTIONS:
+            labels[text] = self.font.render(text, True, BLACK)
+        labels["Click to set start position"] = self.font.render("Click to set start position", True, GREEN)
+        labels["Click to set end position"] = self.font.render("Click to set end position", True, RED)
+        
+        # Match the display format so blitting the labels takes SDL's fast path
+        return {text: surf.convert_alpha() for text, surf in labels.items()}
+    
+    def _tile_blits(self, tile: pygame.Surface, cells, inset: int) -> List:
+        """Build blits() pairs placing a tile on each cell, with vectorized pixel lookups.
+        
+        Args:
+            tile: Surface to draw on every cell
+            cells: Iterable of (x, y) cells
+            inset: Offset of the tile from the cell's top-left corner in pixels
+            
+        Returns:
+            List of (tile, (pixel_x, pixel_y)) pairs
+        """
+        pixels = self.cells_to_pixels(np.array(list(cells), dtype=np.intp)) + inset
+        return list(zip(repeat(tile), map(tuple, pixels.tolist())))
+    
+    def _cached_blits(self, layer: str, tile: pygame.Surface, cells, inset: int) -> List:
+        """Return the blit sequence of a layer, rebuilding it only when its cells changed.
+        
+        The cells object itself is kept in the cache, so an identity check
+        together with its length detects both replacement and growth.
+        """
+        cached = self._blit_cache.get(layer)
+        if cached is None or cached[0] is not cells or cached[1] != len(cells):
+            cached = (cells, len(cells), self._tile_blits(tile, cells, inset))
+            self._blit_cache[layer] = cached
+        return cached[2]
+    
     def cell_to_pixel(self, cell: Tuple[int, int]) -> Tuple[int, int]:
         """Convert cell coordinates to pixel coordinates."""
         x, y = cell
@@ -99,6 +240,18 @@ class PygameMazeVisualizer:
         pixel_y = y * self.cell_size + self.margin
         return (pixel_x, pixel_y)
     
+    def cells_to_pixels(self, cells: np.ndarray) -> np.ndarray:
+        """Convert many cells to the pixel coordinates of their top-left corners at once.
+        
+        Args:
+            cells: Array of (x, y) cell coordinates with shape (N, 2)
+            
+        Returns:
+            Integer array of (pixel_x, pixel_y) pairs with shape (N, 2)
+        """
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        return cells * self.cell_size + self._grid_origin
+    
     def pixel_to_cell(self, pixel: Tuple[int, int]) -> Optional[Tuple[int, int]]:
         """Convert pixel coordinates to cell coordinates."""
         x, y = pixel
@@ -123,23 +276,81 @@ class PygameMazeVisualizer:
         if not self.path:
             return
         
-        # Draw path cells (except start/end)
-        for i in range(1, len(self.path) - 1):
-            cell = self.path[i]
-            pixel_x, pixel_y = self.cell_to_pixel(cell)
+        # Draw path cells (except start/end) in a single batch
+        blits = self._cached_blits("path", self._path_tile, self.path, 5)
+        self.screen.blits(blits[1:-1], doreturn=False)
+    
+    def _draw_title(self, surface: pygame.Surface):
+        """Draw the panel title onto the given surface."""
+        surface.blit(self._label_surfs["A* Maze Visualization"], (20, 15))
+    
+    def _draw_legend(self, surface: pygame.Surface):
+        """Draw the legend at the bottom of the control panel."""
+        # Draw legend with clearer separation from other elements - always at the bottom
+        legend_y = self.screen_height - 160
+        surface.blit(self._label_surfs["Legend:"], (20, legend_y))
+        
+        # Draw legend items with more spacing
+        for i, (color, text) in enumerate(LEGENDS):
+            y_offset = legend_y + 30 + i * 25
+            pygame.draw.rect(surface, color, (20, y_offset, 20, 20))
+            surface.blit(self._label_surfs[text], (50, y_offset + 2))
+    
+    @staticmethod
+    def _wall_runs(lines: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find the runs of consecutive walls along each grid line.
+        
+        Args:
+            lines: Bool array, one row per grid line, True where a cell edge is a wall
             
-            # Fill the cell with yellow
-            pygame.draw.rect(self.screen, YELLOW,
-                          (pixel_x + 5, pixel_y + 5, self.cell_size - 10, self.cell_size - 10))
+        Returns:
+            Tuple (line, first, last) of arrays: the grid line of each run and
+            the first and one-past-last cell edge it covers
+        """
+        padded = np.zeros((lines.shape[0], lines.shape[1] + 2), dtype=np.int8)
+        padded[:, 1:-1] = lines
+        changes = np.diff(padded, axis=1)
+        line, first = np.nonzero(changes == 1)
+        _, last = np.nonzero(changes == -1)
+        return line, first, last
     
-    def draw_maze(self):
-        """Draw the maze with walls, cells, and path."""
-        # Fill the background
-        self.screen.fill(WHITE)
+    def _build_wall_segments(self):
+        """Compute one line segment per straight run of walls, border included.
         
-        # Draw control panel background
-        pygame.draw.rect(self.screen, LIGHT_BLUE, 
-                        (0, 0, self.control_panel_width, self.screen_height))
+        Only walls are drawn, so no eraser pass is needed. Runs are extended
+        by a pixel at each end so that corners join without a notch.
+        """
+        left = self.control_panel_width + self.margin
+        top = self.margin
+        cell_size = self.cell_size
+        
+        # Vertical grid lines: the two borders plus the wall right of each column
+        vertical = np.ones((self.width + 1, self.height), dtype=bool)
+        vertical[1:-1] = self._wall_right
+        xs, first, last = self._wall_runs(vertical)
+        line_x = (left + xs * cell_size).tolist()
+        segments = list(zip(zip(line_x, (top + first * cell_size - 1).tolist()),
+                            zip(line_x, (top + last * cell_size + 1).tolist())))
+        
+        # Horizontal grid lines: the two borders plus the wall below each row
+        horizontal = np.ones((self.height + 1, self.width), dtype=bool)
+        horizontal[1:-1] = self._wall_down.T
+        ys, first, last = self._wall_runs(horizontal)
+        line_y = (top + ys * cell_size).tolist()
+        segments += list(zip(zip((left + first * cell_size - 1).tolist(), line_y),
+                             zip((left + last * cell_size + 1).tolist(), line_y)))
+        self._wall_segments = segments
+    
+    def _render_static(self):
+        """Render the maze walls, which only change on regeneration, into the cached background.
+        
+        ``draw_maze`` blits the result once per frame instead of redrawing
+        the grid.
+        """
+        surface = self._static_bg
+        
+        # Fill the background
+        surface.fill(WHITE)
         
         # Draw the maze grid - all white cells
         maze_width = self.width * self.cell_size
@@ -150,195 +361,178 @@ class PygameMazeVisualizer:
             maze_width, 
             maze_height
         )
-        pygame.draw.rect(self.screen, WHITE, maze_rect)
+        pygame.draw.rect(surface, WHITE, maze_rect)
         
-        # Draw explored nodes if enabled - draw ALL explored nodes (including those under the path)
-        if self.show_exploration:
-            for cell in self.explored_nodes:
-                pixel_x, pixel_y = self.cell_to_pixel(cell)
-                pygame.draw.rect(self.screen, MAGENTA,
-                               (pixel_x + 3, pixel_y + 3, 
-                                self.cell_size - 6, self.cell_size - 6))
+        # Draw each straight run of walls as a single line. Cells are inset far
+        # enough that the walls never overlap them, so the walls can sit
+        # underneath the dynamic layer.
+        wall_thickness = 3
+        draw_line = pygame.draw.line
         
-        # Draw the path on top of explored nodes
-        if self.path:
-            self.draw_path()
+        # Lock once for the whole line batch instead of once per primitive
+        surface.lock()
+        for start, end in self._wall_segments:
+            draw_line(surface, BLACK, start, end, wall_thickness)
+        surface.unlock()
         
-        # Draw start and end points (always on top)
-        start_pixel_x, start_pixel_y = self.cell_to_pixel(self.start_pos)
-        end_pixel_x, end_pixel_y = self.cell_to_pixel(self.end_pos)
+    def _render_control_panel(self):
+        """Render the control panel for the current mode into its cached surface.
         
-        pygame.draw.rect(self.screen, GREEN,
-                        (start_pixel_x + 5, start_pixel_y + 5, 
-                         self.cell_size - 10, self.cell_size - 10))
-        pygame.draw.rect(self.screen, RED,
-                        (end_pixel_x + 5, end_pixel_y + 5, 
-                         self.cell_size - 10, self.cell_size - 10))
-        
-        # WALL DRAWING APPROACH - draw a complete grid, then erase walls where there are passages
-        wall_thickness = 3
+        Called on regeneration and whenever seed entry is opened or closed.
+        Only the typed seed, the cursor and the legend above them are drawn
+        per frame on top of it.
+        """
+        surface = self._control_panel_surf
+        self._panel_entering_seed = self.entering_seed
         
-        # First, draw the grid lines to represent all potential walls
-        for x in range(self.width + 1):
-            # Draw vertical grid lines
-            start_x = self.control_panel_width + self.margin + x * self.cell_size
-            start_y = self.margin
-            end_y = self.margin + self.height * self.cell_size
-            pygame.draw.line(self.screen, BLACK, (start_x, start_y), (start_x, end_y), wall_thickness)
-        
-        for y in range(self.height + 1):
-            # Draw horizontal grid lines
-            start_x = self.control_panel_width + self.margin
-            start_y = self.margin + y * self.cell_size
-            end_x = self.control_panel_width + self.margin + self.width * self.cell_size
-            pygame.draw.line(self.screen, BLACK, (start_x, start_y), (end_x, start_y), wall_thickness)
-        
-        # Now remove walls where there's a passage (not in self.walls)
-        for x in range(self.width):
-            for y in range(self.height):
-                # Check right passage
-                if x < self.width - 1:
-                    wall = tuple(sorted([(x, y), (x + 1, y)]))
-                    if wall not in self.walls:
-                        # Draw a white line to "erase" the wall
-                        start_x = self.control_panel_width + self.margin + (x + 1) * self.cell_size
-                        start_y = self.margin + y * self.cell_size + 2
-                        end_y = self.margin + (y + 1) * self.cell_size - 2
-                        pygame.draw.line(self.screen, WHITE, (start_x, start_y), (start_x, end_y), wall_thickness + 2)
-                
-                # Check bottom passage
-                if y < self.height - 1:
-                    wall = tuple(sorted([(x, y), (x, y + 1)]))
-                    if wall not in self.walls:
-                        # Draw a white line to "erase" the wall
-                        start_x = self.control_panel_width + self.margin + x * self.cell_size + 2
-                        start_y = self.margin + (y + 1) * self.cell_size
-                        end_x = self.control_panel_width + self.margin + (x + 1) * self.cell_size - 2
-                        pygame.draw.line(self.screen, WHITE, (start_x, start_y), (end_x, start_y), wall_thickness + 2)
+        # Draw control panel background
+        surface.fill(LIGHT_BLUE)
         
         # Draw controls information on the left panel with better spacing and organization
-        title_font = pygame.font.SysFont('Arial', 20, bold=True)
-        title = title_font.render("A* Maze Visualization", True, BLACK)
-        self.screen.blit(title, (20, 15))
-        
-        controls = [
-            ("Controls:", True),  # Section header
-            ("R: Regenerate maze", False),
-            ("S: Set start position (click)", False),
-            ("E: Set end position (click)", False),
-            ("A: Toggle animation", False),
-            ("Space: Find path", False),
-            ("D: Set seed for debugging", False),
-            ("Q: Quit", False)
-        ]
+        self._draw_title(surface)
         
         # If seed input is active, we need a different layout to prevent overlapping
         if self.entering_seed:
-            # Simplified control panel when entering seed to avoid overlaps
-            max_y_pos = 50
-            for i, (text, is_header) in enumerate(controls[:4]):  # Draw only first 4 controls
-                if is_header:
-                    font = pygame.font.SysFont('Arial', 18, bold=True)
-                    max_y_pos += 10
-                else:
-                    font = self.font
-                    
-                text_surface = font.render(text, True, BLACK)
-                self.screen.blit(text_surface, (20, max_y_pos))
-                max_y_pos += 25
-            
-            # Draw a semi-transparent overlay for the seed input area
-            seed_input_rect = pygame.Rect(10, max_y_pos, self.control_panel_width - 20, 150)
-            overlay = pygame.Surface((seed_input_rect.width, seed_input_rect.height), pygame.SRCALPHA)
-            overlay.fill((200, 225, 255, 240))  # Light blue with some transparency
-            self.screen.blit(overlay, seed_input_rect)
-            
-            # Draw border around seed input area
-            pygame.draw.rect(self.screen, BLACK, seed_input_rect, 2)
-            
-            # Draw the seed input header
-            seed_header = pygame.font.SysFont('Arial', 18, bold=True).render("Enter Seed Value:", True, BLACK)
-            self.screen.blit(seed_header, (20, max_y_pos + 15))
-            
-            # Draw instructions
-            instructions = [
-                "Type a number to set a specific seed",
-                "Press Enter to confirm",
-                "Press Esc to cancel"
-            ]
-            
-            for i, text in enumerate(instructions):
-                self.screen.blit(self.font.render(text, True, BLACK), (20, max_y_pos + 45 + i * 20))
-            
-            # Draw the input field with a white background
-            input_y = max_y_pos + 45 + len(instructions) * 20 + 10
-            pygame.draw.rect(self.screen, WHITE, (20, input_y, 210, 30))
-            pygame.draw.rect(self.screen, BLACK, (20, input_y, 210, 30), 1)
-            
-            # Show the cursor blinking effect
-            if pygame.time.get_ticks() - self.cursor_blink_time > 500:
-                self.seed_cursor_visible = not self.seed_cursor_visible
-                self.cursor_blink_time = pygame.time.get_ticks()
-                
-            input_text = self.seed_input
-            if self.seed_cursor_visible:
-                input_text += "|"
-                
-            self.screen.blit(self.font.render(input_text, True, BLACK), (25, input_y + 7))
-            
-            # Continue drawing the remaining controls below the seed input area
-            y_pos = max_y_pos + 170
-            for i, (text, is_header) in enumerate(controls[4:]):  # Draw remaining controls
-                if is_header:
-                    font = pygame.font.SysFont('Arial', 18, bold=True)
-                    y_pos += 10
-                else:
-                    font = self.font
-                    
-                text_surface = font.render(text, True, BLACK)
-                self.screen.blit(text_surface, (20, y_pos))
-                y_pos += 25
-                
+            self._draw_seed_panel(surface)
         else:
             # Normal control panel when not entering seed
             y_pos = 50
-            for text, is_header in controls:
+            for text, is_header in CONTROLS:
                 if is_header:
                     # Headers are bold and have more space above them
-                    font = pygame.font.SysFont('Arial', 18, bold=True)
                     y_pos += 10
-                else:
-                    font = self.font
                     
-                text_surface = font.render(text, True, BLACK)
-                self.screen.blit(text_surface, (20, y_pos))
+                surface.blit(self._label_surfs[text], (20, y_pos))
                 y_pos += 25  # More spacing between controls
             
             # Draw seed information in a cleaner format
             seed_y = y_pos + 20
-            seed_header = pygame.font.SysFont('Arial', 18, bold=True).render("Debugging Info:", True, BLACK)
-            self.screen.blit(seed_header, (20, seed_y))
+            surface.blit(self._label_surfs["Debugging Info:"], (20, seed_y))
             
             seed_text = f"Current Seed: {self.seed if self.seed is not None else 'Random'}"
-            self.screen.blit(self.font.render(seed_text, True, BLACK), (20, seed_y + 25))
+            surface.blit(self.font.render(seed_text, True, BLACK), (20, seed_y + 25))
+            
+            # During seed entry the legend is drawn per frame, above the input field
+            self._draw_legend(surface)
+    
+    def _draw_seed_panel(self, surface: pygame.Surface):
+        """Draw the control list split around the seed input box."""
+        # Simplified control panel when entering seed to avoid overlaps
+        max_y_pos = 50
+        for i, (text, is_header) in enumerate(CONTROLS[:4]):  # Draw only first 4 controls
+            if is_header:
+                max_y_pos += 10
+                
+            surface.blit(self._label_surfs[text], (20, max_y_pos))
+            max_y_pos += 25
+        
+        # Draw a semi-transparent overlay for the seed input area
+        seed_input_rect = self._seed_overlay.get_rect(topleft=(10, max_y_pos))
+        surface.blit(self._seed_overlay, seed_input_rect)
+        
+        # Draw border around seed input area
+        pygame.draw.rect(surface, BLACK, seed_input_rect, 2)
+        
+        # Draw the seed input header
+        surface.blit(self._label_surfs["Enter Seed Value:"], (20, max_y_pos + 15))
+        
+        # Draw instructions
+        for i, text in enumerate(SEED_INSTRUCTIONS):
+            surface.blit(self._label_surfs[text], (20, max_y_pos + 45 + i * 20))
+        
+        # Draw the input field with a white background
+        input_y = max_y_pos + 45 + len(SEED_INSTRUCTIONS) * 20 + 10
+        self._seed_field_rect = pygame.Rect(20, input_y, 210, 30)
+        pygame.draw.rect(surface, WHITE, self._seed_field_rect)
+        pygame.draw.rect(surface, BLACK, self._seed_field_rect, 1)
+        self._seed_text_pos = (25, input_y + 7)
+        
+        # Continue drawing the remaining controls below the seed input area
+        y_pos = max_y_pos + 170
+        for i, (text, is_header) in enumerate(CONTROLS[4:]):  # Draw remaining controls
+            if is_header:
+                y_pos += 10
+                
+            surface.blit(self._label_surfs[text], (20, y_pos))
+            y_pos += 25
+    
+    def _seed_text_surf(self) -> pygame.Surface:
+        """Return the rendered seed text, re-rendering it only when the input changed."""
+        if self._seed_text[0] != self.seed_input:
+            self._seed_text = (self.seed_input, self.font.render(self.seed_input, True, BLACK))
+        return self._seed_text[1]
+    
+    def _draw_seed_input(self):
+        """Draw the typed seed and the blinking cursor into the input field."""
+        # Show the cursor blinking effect
+        if pygame.time.get_ticks() - self.cursor_blink_time > 500:
+            self.seed_cursor_visible = not self.seed_cursor_visible
+            self.cursor_blink_time = pygame.time.get_ticks()
+            
+        text_surf = self._seed_text_surf()
         
-        # Draw legend with clearer separation from other elements - always at the bottom
-        legend_y = self.screen_height - 160
-        legend_header = pygame.font.SysFont('Arial', 18, bold=True).render("Legend:", True, BLACK)
-        self.screen.blit(legend_header, (20, legend_y))
+        text_x, text_y = self._seed_text_pos
+        self.screen.blit(text_surf, (text_x, text_y))
+        if self.seed_cursor_visible:
+            self.screen.blit(self._cursor_surf, (text_x + text_surf.get_width(), text_y))
         
-        # Draw legend items with more spacing
-        legends = [
-            (GREEN, "Start position"),
-            (RED, "End position"),
-            (YELLOW, "Path"),
-            (MAGENTA, "Explored nodes")
-        ]
-        
-        for i, (color, text) in enumerate(legends):
-            y_offset = legend_y + 30 + i * 25
-            pygame.draw.rect(self.screen, color, (20, y_offset, 20, 20))
-            self.screen.blit(self.font.render(text, True, BLACK), (50, y_offset + 2))
+        # In short windows the legend overlaps the input field, so it goes on top
+        self._draw_legend(self.screen)
+    
+    def _redraw_seed_field(self):
+        """Redraw and present only the seed input field, for cursor blinks and typing.
+        
+        Typed text that has grown past the field also covers pixels outside
+        it, so in that case the whole frame is redrawn instead.
+        """
+        field = self._seed_field_rect
+        text_right = self._seed_text_pos[0] + self._seed_text_surf().get_width() + self._cursor_surf.get_width()
+        if text_right > field.right:
+            self.draw_maze()
+            pygame.display.flip()
+            return
+        
+        self.screen.set_clip(field)
+        self.screen.blit(self._control_panel_surf, field, field)
+        self._draw_seed_input()
+        self.screen.set_clip(None)
+        pygame.display.update(field)
+    
+    def draw_maze(self):
+        """Draw the maze with walls, cells, and path."""
+        # Start from the cached walls and control panel, re-rendering the
+        # panel only when seed entry was opened or closed
+        self.screen.blit(self._static_bg, (0, 0))
+        if self.entering_seed != self._panel_entering_seed:
+            self._render_control_panel()
+        self.screen.blit(self._control_panel_surf, (0, 0))
+        
+        if self.entering_seed:
+            self._draw_seed_input()
+        
+        # Draw explored nodes if enabled - draw ALL explored nodes (including those under the path)
+        if self.show_exploration and self.explored_nodes:
+            blits = self._cached_blits("explored", self._explored_tile, self.explored_nodes, 3)
+            self.screen.blits(blits, doreturn=False)
+        
+        # Draw the path on top of explored nodes
+        if self.path:
+            self.draw_path()
+        
+        # Draw start and end points (always on top)
+        start_pixel_x, start_pixel_y = self.cell_to_pixel(self.start_pos)
+        end_pixel_x, end_pixel_y = self.cell_to_pixel(self.end_pos)
+        
+        self.screen.blit(self._start_tile, (start_pixel_x + 5, start_pixel_y + 5))
+        self.screen.blit(self._end_tile, (end_pixel_x + 5, end_pixel_y + 5))
+        
+        # Show selection mode indicator
+        if self.selecting_start:
+            text = self._label_surfs["Click to set start position"]
+            self.screen.blit(text, (self.control_panel_width + (self.screen_width - self.control_panel_width) // 2 - 100, 10))
+        elif self.selecting_end:
+            text = self._label_surfs["Click to set end position"]
+            self.screen.blit(text, (self.control_panel_width + (self.screen_width - self.control_panel_width) // 2 - 100, 10))
     
     def update_seed_and_regenerate(self):
         """Update the seed from the input and regenerate the maze."""
@@ -356,60 +550,135 @@ class PygameMazeVisualizer:
         self.entering_seed = False
     
     def regenerate_maze(self):
-        """Regenerate the maze and recalculate the path."""
-        self.maze_generator = MazeGenerator(self.width, self.height, seed=self.seed)
+        """Regenerate the maze and recalculate the path.
+        
+        The generator and A* instances are reset in place so their arrays and
+        search buffers are reused.
+        """
+        self.maze_generator.reset(self.seed)
         self.walls = self.maze_generator.generate()
-        self.astar = AStar(self.width, self.height, self.walls)
+        self._wall_right = self.maze_generator.wall_v
+        self._wall_down = self.maze_generator.wall_h
+        self.astar.reset(self.walls, self._wall_down, self._wall_right)
         self.path = self.astar.find_path(self.start_pos, self.end_pos)
         self.explored_nodes = self.astar.get_explored_nodes()
+        self._pending_query = None
+        self._build_wall_segments()
+        self._render_static()
+        self._render_control_panel()
+        self._dirty = True
     
     def animate_pathfinding(self):
         """Animate the A* pathfinding process."""
         self.animation_in_progress = True
-        self.explored_nodes = set()
         
-        # Create a new A* instance for animation
-        astar = AStar(self.width, self.height, self.walls)
+        # Reuse the maze's A* instance, its walls are already current
+        astar = self.astar
         
         # Get the step by step process of the algorithm
         path = astar.find_path(self.start_pos, self.end_pos)
         self.path = path
         
-        # For animation, we'll use the explored nodes from A*
-        explored_sequence = list(astar.get_explored_nodes())
-        
-        # Sort the explored nodes by distance from start (approximate)
-        explored_sequence.sort(key=lambda pos: abs(pos[0] - self.start_pos[0]) + abs(pos[1] - self.start_pos[1]))
+        # For animation, replay the nodes in the order A* actually expanded them
+        explored_sequence = astar.get_explored_order()
         
-        # Animate the exploration
+        # Draw the maze once, every step then only touches the newly explored cell
         self.explored_nodes = set()
-        for node in explored_sequence:
-            self.explored_nodes.add(node)
-            self.draw_maze()
-            pygame.display.flip()
-            pygame.time.delay(self.animation_speed)
+        self.draw_maze()
+        pygame.display.flip()
+        
+        # Cells on the path keep their path, start or end tile on top
+        overlay_tiles = {cell: self._path_tile for cell in (path or [])[1:-1]}
+        overlay_tiles[self.start_pos] = self._start_tile
+        overlay_tiles[self.end_pos] = self._end_tile
+        
+        # Hoist the lookups used on every animation step
+        add_explored = self.explored_nodes.add
+        blit = self.screen.blit
+        explored_tile = self._explored_tile
+        tile_size = self.cell_size - 6
+        update = pygame.display.update
+        delay = pygame.time.delay
+        animation_speed = self.animation_speed
+        
+        # Animate the exploration, presenting the accumulated cells once per frame
+        pending = []
+        waited = 0
+        pixels = self.cells_to_pixels(explored_sequence).tolist()
+        for node, (pixel_x, pixel_y) in zip(explored_sequence, pixels):
+            add_explored(node)
+            blit(explored_tile, (pixel_x + 3, pixel_y + 3))
+            overlay = overlay_tiles.get(node)
+            if overlay is not None:
+                blit(overlay, (pixel_x + 5, pixel_y + 5))
+            pending.append((pixel_x + 3, pixel_y + 3, tile_size, tile_size))
             
-            # Check for quit events during animation
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_q:
-                        pygame.quit()
-                        sys.exit()
+            delay(animation_speed)
+            waited += animation_speed
+            if waited >= ANIMATION_FRAME_MS:
+                update(pending)
+                pending = []
+                waited = 0
+                self._handle_animation_events()
+        
+        update(pending)
+        self._handle_animation_events()
         
         # Set the final result
         self.explored_nodes = set(explored_sequence)
         self.animation_in_progress = False
     
+    def handle_cell_click(self, cell: Tuple[int, int]):
+        """Apply a click on a maze cell in the current selection mode.
+        
+        The path is not recalculated here; the query is stored and run once
+        before the next frame, so several clicks in one frame cost one search.
+        
+        Args:
+            cell: The clicked cell
+        """
+        if self.selecting_start:
+            self.start_pos = cell
+            self.selecting_start = False
+        elif self.selecting_end:
+            self.end_pos = cell
+            self.selecting_end = False
+        else:
+            return
+        self._pending_query = (self.start_pos, self.end_pos)
+    
+    def run_pending_query(self):
+        """Recalculate the path for the pending start/end query."""
+        start, end = self._pending_query
+        self._pending_query = None
+        self.path = self.astar.find_path(start, end)
+        self.explored_nodes = self.astar.get_explored_nodes()
+        self._dirty = True
+    
+    def _handle_animation_events(self):
+        """Check for quit events during animation."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_q:
+                    pygame.quit()
+                    sys.exit()
+    
     def run(self):
         """Run the main visualization loop."""
         running = True
         clock = pygame.time.Clock()
         
         while running:
+            seed_typed = False
             for event in pygame.event.get():
+                # Input and window exposure are the only things that change the
+                # frame; keys typed into the seed field only touch the field
+                if event.type in REDRAW_EVENTS and not (event.type == pygame.KEYDOWN and self.entering_seed):
+                    self._dirty = True
+                
                 if event.type == pygame.QUIT:
                     running = False
                 
@@ -417,14 +686,18 @@ class PygameMazeVisualizer:
                     if self.entering_seed:
                         if event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
                             self.update_seed_and_regenerate()
+                            self._dirty = True
                         elif event.key == pygame.K_ESCAPE:
                             self.entering_seed = False
+                            self._dirty = True
                         elif event.key == pygame.K_BACKSPACE:
                             self.seed_input = self.seed_input[:-1]
+                            seed_typed = True
                         else:
                             # Only allow numbers to be entered
                             if event.unicode.isdigit():
                                 self.seed_input += event.unicode
+                                seed_typed = True
                     else:
                         if event.key == pygame.K_q:
                             running = False
@@ -457,33 +730,24 @@ class PygameMazeVisualizer:
                     cell = self.pixel_to_cell(mouse_pos)
                     
                     if cell:
-                        if self.selecting_start:
-                            self.start_pos = cell
-                            self.selecting_start = False
-                            # Recalculate path
-                            self.path = self.astar.find_path(self.start_pos, self.end_pos)
-                            self.explored_nodes = self.astar.get_explored_nodes()
-                            
-                        elif self.selecting_end:
-                            self.end_pos = cell
-                            self.selecting_end = False
-                            # Recalculate path
-                            self.path = self.astar.find_path(self.start_pos, self.end_pos)
-                            self.explored_nodes = self.astar.get_explored_nodes()
+                        self.handle_cell_click(cell)
             
-            # Draw the maze and update the display
-            self.draw_maze()
+            # Run the path query collected from this frame's clicks, if any
+            if self._pending_query is not None:
+                self.run_pending_query()
             
-            # Show selection mode indicator
-            if self.selecting_start:
-                text = self.font.render("Click to set start position", True, GREEN)
-                self.screen.blit(text, (self.control_panel_width + (self.screen_width - self.control_panel_width) // 2 - 100, 10))
-            elif self.selecting_end:
-                text = self.font.render("Click to set end position", True, RED)
-                self.screen.blit(text, (self.control_panel_width + (self.screen_width - self.control_panel_width) // 2 - 100, 10))
+            # Only redraw when something changed, idle frames cost nothing
+            if self._dirty:
+                self.draw_maze()
+                pygame.display.flip()
+                self._dirty = False
+            elif self.entering_seed and (seed_typed or pygame.time.get_ticks() - self.cursor_blink_time > 500):
+                # Typing and the blinking cursor only touch the seed input field
+                self._redraw_seed_field()
             
-            pygame.display.flip()
-            clock.tick(60)
+            # Poll at full rate only while something is in progress
+            active = self.animation_in_progress or self.selecting_start or self.selecting_end
+            clock.tick(ACTIVE_FPS if active else IDLE_FPS)
         
         pygame.quit()
 
@@ -0,0 +1,35 @@
+"""
+Cached mazes shared across the test suite.
+
+Tests that only need a fixed maze to render or query call `make_maze`
+instead of generating and solving the same maze in every setUp.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from maze_generator import MazeGenerator
+from astar import AStar
+
+
+@lru_cache(maxsize=None)
+def make_maze(width: int, height: int, seed: int = 42):
+    """Generate a seeded maze and solve it from corner to corner, once per argument set.
+    
+    Args:
+        width: Width of the maze in cells
+        height: Height of the maze in cells
+        seed: Random seed for the maze generator
+        
+    Returns:
+        Tuple of (walls, path, explored). They are immutable (frozenset,
+        tuple, frozenset) because every caller shares the same objects.
+    """
+    walls = MazeGenerator(width, height, seed=seed).generate()
+    a_star = AStar(width, height, walls)
+    path = a_star.find_path((0, 0), (width - 1, height - 1))
+    return frozenset(walls), tuple(path), frozenset(a_star.get_explored_nodes())
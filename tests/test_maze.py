@@ -1,12 +1,15 @@
 import sys
 import os
 import unittest
+from unittest.mock import patch
 
 # Add parent directory to the import path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from maze_generator import MazeGenerator
-from astar import AStar
+import astar
+import maze_generator as maze_generator_module
+from astar import AStar, DAryHeap, HierarchicalAStar, walls_to_arrays
 
 
 class TestMazeAndAStar(unittest.TestCase):
@@ -105,6 +108,283 @@ class TestMazeAndAStar(unittest.TestCase):
             wall = tuple(sorted([current_pos, next_pos]))
             self.assertNotIn(wall, walls, f"Path crosses wall between {current_pos} and {next_pos}")
 
+    def test_explored_order(self):
+        """Test that the expansion order covers the explored nodes from start to end."""
+        width, height = 10, 10
+        maze_generator = MazeGenerator(width, height, seed=7)
+        walls = maze_generator.generate()
+        
+        a_star = AStar(width, height, walls)
+        start = (0, 0)
+        end = (width - 1, height - 1)
+        a_star.find_path(start, end)
+        
+        order = a_star.get_explored_order()
+        self.assertEqual(order[0], start, "Expansion should begin at the start point")
+        self.assertEqual(order[-1], end, "Expansion should stop at the end point")
+        self.assertEqual(len(order), len(set(order)), "Each node should be expanded once")
+        self.assertEqual(set(order), a_star.get_explored_nodes())
+
+    def test_dary_heap_order(self):
+        """Test that the 4-ary heap pops records in non-decreasing f order."""
+        heap = DAryHeap(capacity=2)
+        values = [7, 3, 9, 1, 4, 4, 8, 0, 6, 2, 5, 3]
+        for cid, f in enumerate(values):
+            heap.push(f, cid)
+        self.assertEqual(len(heap), len(values))
+        
+        popped = [heap.pop() for _ in values]
+        self.assertEqual([f for f, _ in popped], sorted(values))
+        self.assertEqual(sorted(cid for _, cid in popped), list(range(len(values))))
+        self.assertEqual(len(heap), 0)
+
+    def test_backends_agree(self):
+        """Test that the compiled and pure-Python searches find equally short paths."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                width, height = 12, 9
+                walls = MazeGenerator(width, height, seed=seed).generate()
+                a_star = AStar(width, height, walls)
+                
+                lengths = []
+                for numba_available in (True, False):
+                    with patch.object(astar, "NUMBA_AVAILABLE", numba_available):
+                        path = a_star.find_path((0, 0), (width - 1, height - 1))
+                    self.assertIsNotNone(path)
+                    lengths.append(len(path))
+                self.assertEqual(lengths[0], lengths[1])
+    
+    def test_ties_break_towards_goal(self):
+        """Test that on an open grid, where every cell ties on f, only the path is expanded."""
+        width, height = 15, 10
+        for numba_available in (True, False):
+            with self.subTest(numba=numba_available), \
+                    patch.object(astar, "NUMBA_AVAILABLE", numba_available and astar.NUMBA_AVAILABLE):
+                a_star = AStar(width, height, set())
+                path = a_star.find_path((0, 0), (width - 1, height - 1))
+                self.assertEqual(len(path), width + height - 1)
+                self.assertEqual(a_star.get_explored_order(), path)
+    
+    def test_heuristic_tables_memoized(self):
+        """Test that repeated queries towards one goal reuse its heuristic table."""
+        width, height = 10, 8
+        walls = MazeGenerator(width, height, seed=4).generate()
+        a_star = AStar(width, height, walls)
+        
+        first = a_star.find_path((0, 0), (9, 7))
+        table = a_star._heuristic_table((9, 7))
+        self.assertEqual(a_star.find_path((0, 0), (9, 7)), first)
+        self.assertIs(a_star._heuristic_table((9, 7)), table)
+        self.assertEqual(table[0], 16)
+        
+        # The cache stays bounded when many goals are queried
+        for x in range(width):
+            for y in range(height):
+                a_star.find_path((0, 0), (x, y))
+        self.assertLessEqual(len(a_star._h_cache), astar._H_CACHE_SIZE)
+        
+        # Also when concurrent batch searches insert and evict goals
+        pairs = [((0, 0), (x, y)) for x in range(width) for y in range(height)] * 4
+        paths = a_star.find_paths_batch(pairs, max_workers=8)
+        self.assertEqual(paths, [a_star.find_path(start, end) for start, end in pairs])
+        self.assertLessEqual(len(a_star._h_cache), astar._H_CACHE_SIZE)
+    
+    def test_reset_reuses_buffers(self):
+        """Test that resetting the generator and A* matches freshly built instances."""
+        width, height = 9, 7
+        generator = MazeGenerator(width, height, seed=1)
+        generator.generate()
+        wall_h = generator.wall_h
+        a_star = AStar(width, height, generator.walls, generator.wall_h, generator.wall_v)
+        a_star.find_path((0, 0), (8, 6))
+        explored_buffer = a_star._explored_order
+        
+        generator.reset(seed=2)
+        walls = generator.generate()
+        a_star.reset(walls, generator.wall_h, generator.wall_v)
+        self.assertIs(generator.wall_h, wall_h)
+        self.assertIs(a_star._explored_order, explored_buffer)
+        self.assertEqual(a_star.get_explored_nodes(), set())
+        
+        # Same maze and path as instances built from scratch with the new seed
+        fresh_walls = MazeGenerator(width, height, seed=2).generate()
+        self.assertEqual(walls, fresh_walls)
+        self.assertEqual(a_star.find_path((0, 0), (8, 6)),
+                         AStar(width, height, fresh_walls).find_path((0, 0), (8, 6)))
+    
+    def test_regeneration_keeps_existing_astar_consistent(self):
+        """Test that regenerating the maze under an existing AStar leaves its searches on the old maze."""
+        width, height = 9, 7
+        generator = MazeGenerator(width, height, seed=1)
+        old_walls = generator.generate()
+        a_star = AStar(width, height, old_walls, generator.wall_h, generator.wall_v)
+        expected = AStar(width, height, old_walls).find_path((0, 0), (width - 1, height - 1))
+        
+        # The generator refills its wall arrays in place for the new maze
+        generator.reset(seed=2)
+        self.assertNotEqual(generator.generate(), old_walls)
+        
+        path = a_star.find_path((0, 0), (width - 1, height - 1))
+        self.assertEqual(path, expected)
+        self.assertEqual(a_star.find_path_jps((0, 0), (width - 1, height - 1)), path)
+    
+    def test_unreachable_end(self):
+        """Test that A* returns None when the end is walled off."""
+        width, height = 3, 3
+        walls = {((1, 2), (2, 2)), ((2, 1), (2, 2))}
+        a_star = AStar(width, height, walls)
+        
+        for numba_available in (True, False):
+            with patch.object(astar, "NUMBA_AVAILABLE", numba_available):
+                self.assertIsNone(a_star.find_path((0, 0), (2, 2)))
+                self.assertEqual(len(a_star.get_explored_nodes()), 8)
+
+    def test_bidirectional_matches_astar(self):
+        """Test that bidirectional search finds paths as short as plain A*."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                width, height = 15, 11
+                walls = MazeGenerator(width, height, seed=seed).generate()
+                a_star = AStar(width, height, walls)
+                start, end = (2, 1), (width - 1, height - 3)
+                
+                expected = a_star.find_path(start, end)
+                path = a_star.find_path_bidir(start, end)
+                
+                self.assertEqual(len(path), len(expected))
+                self.assertEqual(path[0], start)
+                self.assertEqual(path[-1], end)
+                for a, b in zip(path, path[1:]):
+                    self.assertEqual(abs(a[0] - b[0]) + abs(a[1] - b[1]), 1)
+                    self.assertNotIn(tuple(sorted([a, b])), walls)
+        
+        self.assertEqual(a_star.find_path_bidir((3, 3), (3, 3)), [(3, 3)])
+        blocked = AStar(3, 3, {((1, 2), (2, 2)), ((2, 1), (2, 2))})
+        self.assertIsNone(blocked.find_path_bidir((0, 0), (2, 2)))
+
+    def test_jump_point_search_matches_astar(self):
+        """Test that Jump Point Search returns a valid shortest path with fewer expansions."""
+        for seed in range(5):
+            with self.subTest(seed=seed):
+                width, height = 15, 15
+                walls = MazeGenerator(width, height, seed=seed).generate()
+                a_star = AStar(width, height, walls)
+                start, end = (0, 0), (width - 1, height - 1)
+                
+                expected = a_star.find_path(start, end)
+                expanded = len(a_star.get_explored_nodes())
+                path = a_star.find_path_jps(start, end)
+                
+                self.assertEqual(path, expected, "A perfect maze has a single shortest path")
+                self.assertLessEqual(len(a_star.get_explored_nodes()), expanded)
+        
+        blocked = AStar(3, 3, {((1, 2), (2, 2)), ((2, 1), (2, 2))})
+        self.assertIsNone(blocked.find_path_jps((0, 0), (2, 2)))
+
+    def test_wall_arrays_match_wall_set(self):
+        """Test that the generator's wall arrays describe the same walls as its wall set."""
+        width, height = 9, 6
+        maze_generator = MazeGenerator(width, height, seed=3)
+        walls = maze_generator.generate()
+        
+        wall_h, wall_v = walls_to_arrays(width, height, walls)
+        self.assertTrue((wall_h == maze_generator.wall_h).all())
+        self.assertTrue((wall_v == maze_generator.wall_v).all())
+        self.assertEqual(int(wall_h.sum() + wall_v.sum()), len(walls))
+        
+        from_set = AStar(width, height, walls).find_path((0, 0), (width - 1, height - 1))
+        from_arrays = AStar(width, height, wall_h=maze_generator.wall_h,
+                            wall_v=maze_generator.wall_v).find_path((0, 0), (width - 1, height - 1))
+        self.assertEqual(from_set, from_arrays)
+
+    def test_deep_maze_generation(self):
+        """Test that a maze deeper than the recursion limit generates as a spanning tree."""
+        width, height = 60, 60
+        maze_generator = MazeGenerator(width, height, seed=8)
+        walls = maze_generator.generate()
+        
+        # A perfect maze opens exactly one edge per cell but one
+        total_edges = (width - 1) * height + width * (height - 1)
+        self.assertEqual(total_edges - len(walls), width * height - 1)
+        self.assertTrue(maze_generator.visited.all())
+
+    def test_generator_backends(self):
+        """Test that compiled and pure-Python carving give the same reproducible perfect mazes."""
+        width, height = 13, 9
+        total_edges = (width - 1) * height + width * (height - 1)
+        mazes = {}
+        for numba_available in (True, False):
+            with self.subTest(numba=numba_available), \
+                    patch.object(maze_generator_module, "NUMBA_AVAILABLE", numba_available and astar.NUMBA_AVAILABLE):
+                walls = MazeGenerator(width, height, seed=21).generate()
+                self.assertEqual(total_edges - len(walls), width * height - 1)
+                self.assertEqual(walls, MazeGenerator(width, height, seed=21).generate())
+                path = AStar(width, height, walls).find_path((0, 0), (width - 1, height - 1))
+                self.assertIsNotNone(path)
+                mazes[numba_available] = [MazeGenerator(width, height, seed=seed).generate() for seed in range(20)]
+        
+        # A seed names one maze, whichever backend carves it
+        self.assertEqual(mazes[True], mazes[False])
+
+    def test_walls_property_uses_arrays(self):
+        """Test that the wall set, the wall arrays and is_wall_between agree."""
+        maze_generator = MazeGenerator(6, 4, seed=2)
+        walls = maze_generator.generate()
+        
+        for x in range(6):
+            for y in range(4):
+                if x < 5:
+                    self.assertEqual(maze_generator.is_wall_between((x, y), (x + 1, y)), ((x, y), (x + 1, y)) in walls)
+                    self.assertEqual(maze_generator.is_wall_between((x + 1, y), (x, y)), ((x, y), (x + 1, y)) in walls)
+                if y < 3:
+                    self.assertEqual(maze_generator.is_wall_between((x, y), (x, y + 1)), ((x, y), (x, y + 1)) in walls)
+                    self.assertEqual(maze_generator.is_wall_between((x, y + 1), (x, y)), ((x, y), (x, y + 1)) in walls)
+        for cell in ((1, 1), (0, 0), (2, 0), (0, 2)):
+            with self.assertRaises(ValueError):
+                maze_generator.is_wall_between((0, 0), cell)
+    
+    def test_is_wall_between_outside_maze(self):
+        """Test that edges leading out of the maze report no wall instead of wrapping or raising."""
+        maze_generator = MazeGenerator(4, 4, seed=1)
+        maze_generator.generate()
+        
+        for cell1, cell2 in (((0, 0), (-1, 0)), ((0, 0), (0, -1)), ((-1, 2), (0, 2)),
+                             ((3, 0), (4, 0)), ((0, 3), (0, 4)), ((4, 3), (3, 3)), ((2, 4), (2, 3))):
+            self.assertFalse(maze_generator.is_wall_between(cell1, cell2), (cell1, cell2))
+        
+        # Assigning a wall set rebuilds the arrays
+        maze_generator.walls = {((0, 0), (1, 0))}
+        self.assertEqual(maze_generator.walls, {((0, 0), (1, 0))})
+        self.assertEqual(int(maze_generator.wall_v.sum() + maze_generator.wall_h.sum()), 1)
+        self.assertTrue(maze_generator.is_wall_between((1, 0), (0, 0)))
+
+    def test_find_paths_batch(self):
+        """Test that batched searches return the same paths as individual calls."""
+        width, height = 12, 12
+        walls = MazeGenerator(width, height, seed=11).generate()
+        a_star = AStar(width, height, walls)
+        pairs = [((0, 0), (11, 11)), ((5, 2), (1, 9)), ((7, 7), (7, 7)), ((11, 0), (0, 11))]
+        
+        paths = a_star.find_paths_batch(pairs, max_workers=2)
+        self.assertEqual(paths, [a_star.find_path(start, end) for start, end in pairs])
+    
+    def test_hierarchical_matches_astar(self):
+        """Test that HPA* finds valid shortest paths across and within chunks."""
+        width, height = 20, 17
+        walls = MazeGenerator(width, height, seed=5).generate()
+        a_star = AStar(width, height, walls)
+        hierarchical = HierarchicalAStar(width, height, walls, chunk_size=6)
+        pairs = [((0, 0), (19, 16)), ((2, 3), (4, 1)), ((18, 2), (1, 15)), ((9, 9), (9, 9))]
+        
+        for start, end in pairs:
+            path = hierarchical.find_path(start, end)
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], end)
+            self.assertEqual(len(path), len(a_star.find_path(start, end)))
+            for a, b in zip(path, path[1:]):
+                self.assertEqual(abs(a[0] - b[0]) + abs(a[1] - b[1]), 1)
+                self.assertNotIn(tuple(sorted([a, b])), walls)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
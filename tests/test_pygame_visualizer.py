@@ -18,6 +18,7 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Import the modules to test
 from maze_generator import MazeGenerator
 from astar import AStar
+from tests._fixtures import make_maze
 import pygame
 
 # Try to import the pygame visualizer
@@ -31,19 +32,25 @@ except ImportError:
 class TestPygameMazeVisualizer(unittest.TestCase):
     """Test the Pygame maze visualizer."""
 
-    def setUp(self):
-        """Set up the test environment with mocked pygame components if needed."""
+    @classmethod
+    def setUpClass(cls):
+        """Initialize pygame once for the whole test class."""
         # Initialize pygame in headless mode if possible
         os.environ['SDL_VIDEODRIVER'] = 'dummy'
         try:
             pygame.init()
         except:
-            self.skipTest("Pygame couldn't initialize, skipping tests.")
+            raise unittest.SkipTest("Pygame couldn't initialize, skipping tests.")
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up after the tests."""
         pygame.quit()
     
+    def tearDown(self):
+        """Close the test's window; each visualizer opens its own SCALED display."""
+        pygame.display.quit()
+    
     def test_maze_generation_and_pathfinding(self):
         """Test that maze generation and pathfinding still work correctly."""
         # Create a small maze for testing
@@ -100,7 +107,19 @@ class TestPygameMazeVisualizer(unittest.TestCase):
         pixel = (margin - 5, margin - 5)  # Outside the maze area
         cell = visualizer.pixel_to_cell(pixel)
         self.assertIsNone(cell, "Out-of-bounds pixel should convert to None")
-    
+
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_cells_to_pixels(self):
+        """Test that the vectorized conversion matches cell_to_pixel for every cell."""
+        visualizer = PygameMazeVisualizer(7, 5, cell_size=30, margin=20)
+        cells = [(x, y) for y in range(5) for x in range(7)]
+
+        pixels = visualizer.cells_to_pixels(cells)
+        self.assertEqual(pixels.shape, (len(cells), 2))
+        self.assertEqual([tuple(pixel) for pixel in pixels.tolist()],
+                         [visualizer.cell_to_pixel(cell) for cell in cells])
+        self.assertEqual(visualizer.cells_to_pixels([]).shape, (0, 2))
+
     @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
     def test_maze_regeneration(self):
         """Test regenerating the maze."""
@@ -155,6 +174,198 @@ class TestPygameMazeVisualizer(unittest.TestCase):
         except Exception as e:
             self.fail(f"Drawing maze raised exception: {e}")
     
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_static_background_cache(self):
+        """Test that walls are cached in the static background and refreshed on regeneration."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        before = pygame.image.tostring(visualizer._static_bg, "RGB")
+        
+        # Drawing frames must not touch the cached layer
+        visualizer.draw_maze()
+        self.assertEqual(pygame.image.tostring(visualizer._static_bg, "RGB"), before)
+        
+        # A new maze has different walls, so the cache must be re-rendered
+        visualizer.seed = 2
+        visualizer.regenerate_maze()
+        self.assertNotEqual(pygame.image.tostring(visualizer._static_bg, "RGB"), before)
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_blit_sequences_cached(self):
+        """Test that tile positions are reused across frames and rebuilt when cells change."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        visualizer.draw_maze()
+        explored_blits = visualizer._blit_cache["explored"][2]
+        visualizer.draw_maze()
+        self.assertIs(visualizer._blit_cache["explored"][2], explored_blits)
+        
+        # Positions match the scalar conversion
+        for tile, (pixel_x, pixel_y) in explored_blits:
+            self.assertIn(visualizer.pixel_to_cell((pixel_x, pixel_y)), visualizer.explored_nodes)
+        
+        visualizer.explored_nodes = {(4, 4)}
+        visualizer.draw_maze()
+        pixel_x, pixel_y = visualizer.cell_to_pixel((4, 4))
+        self.assertEqual(visualizer._blit_cache["explored"][2][0][1], (pixel_x + 3, pixel_y + 3))
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_wall_arrays_match_walls(self):
+        """Test that the wall arrays agree with the wall set after regeneration."""
+        visualizer = PygameMazeVisualizer(7, 5, seed=2, walls=make_maze(7, 5, seed=2)[0])
+        visualizer.seed = 3
+        visualizer.regenerate_maze()
+        
+        for x in range(6):
+            for y in range(5):
+                self.assertEqual(bool(visualizer._wall_right[x, y]), ((x, y), (x + 1, y)) in visualizer.walls)
+        for x in range(7):
+            for y in range(4):
+                self.assertEqual(bool(visualizer._wall_down[x, y]), ((x, y), (x, y + 1)) in visualizer.walls)
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_cell_tiles_drawn(self):
+        """Test that the batched tiles land on the explored and path cells."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        visualizer.draw_maze()
+        
+        path_cells = set(visualizer.path)
+        for cell in visualizer.explored_nodes - path_cells:
+            pixel_x, pixel_y = visualizer.cell_to_pixel(cell)
+            self.assertEqual(visualizer.screen.get_at((pixel_x + 4, pixel_y + 4))[:3], (255, 0, 255))
+        for cell in visualizer.path[1:-1]:
+            pixel_x, pixel_y = visualizer.cell_to_pixel(cell)
+            self.assertEqual(visualizer.screen.get_at((pixel_x + 6, pixel_y + 6))[:3], (255, 255, 0))
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_only_walls_drawn(self):
+        """Test that walls are drawn and passages left open on the static background."""
+        width, height = 8, 6
+        visualizer = PygameMazeVisualizer(width, height, seed=4, walls=make_maze(width, height, seed=4)[0])
+        surface = visualizer._static_bg
+        left = visualizer.control_panel_width + visualizer.margin
+        top = visualizer.margin
+        half = visualizer.cell_size // 2
+        
+        # Probe the middle of every inner cell edge
+        for x in range(width - 1):
+            for y in range(height):
+                pixel = surface.get_at((left + (x + 1) * visualizer.cell_size, top + y * visualizer.cell_size + half))
+                expected = (0, 0, 0) if ((x, y), (x + 1, y)) in visualizer.walls else (255, 255, 255)
+                self.assertEqual(pixel[:3], expected)
+        for x in range(width):
+            for y in range(height - 1):
+                pixel = surface.get_at((left + x * visualizer.cell_size + half, top + (y + 1) * visualizer.cell_size))
+                expected = (0, 0, 0) if ((x, y), (x, y + 1)) in visualizer.walls else (255, 255, 255)
+                self.assertEqual(pixel[:3], expected)
+        
+        # The outer border is always closed, including its corners
+        self.assertEqual(surface.get_at((left - 1, top - 1))[:3], (0, 0, 0))
+        self.assertEqual(surface.get_at((left + width * visualizer.cell_size + 1,
+                                         top + height * visualizer.cell_size + 1))[:3], (0, 0, 0))
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_control_panel_rendered_on_mode_change(self):
+        """Test that the control panel is only re-rendered when seed entry toggles."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        renders = []
+        original_render = visualizer._render_control_panel
+        visualizer._render_control_panel = lambda: (renders.append(visualizer.entering_seed), original_render())
+        
+        visualizer.draw_maze()
+        visualizer.draw_maze()
+        self.assertEqual(renders, [])
+        
+        visualizer.entering_seed = True
+        visualizer.draw_maze()
+        visualizer.draw_maze()
+        visualizer.entering_seed = False
+        visualizer.draw_maze()
+        self.assertEqual(renders, [True, False])
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_cursor_blink_matches_full_draw(self):
+        """Test that blinking the cursor in place gives the same frame as a full redraw."""
+        visualizer = PygameMazeVisualizer(7, 12, cell_size=24, seed=5, walls=make_maze(7, 12, seed=5)[0])
+        visualizer.entering_seed = True
+        visualizer.seed_input = "42"
+        visualizer.seed_cursor_visible = True
+        visualizer.cursor_blink_time = pygame.time.get_ticks()
+        visualizer.draw_maze()
+        
+        # Force a blink and redraw only the input field
+        visualizer.cursor_blink_time = -1000
+        visualizer._redraw_seed_field()
+        self.assertFalse(visualizer.seed_cursor_visible)
+        blinked = pygame.image.tostring(visualizer.screen, "RGB")
+        
+        visualizer.cursor_blink_time = pygame.time.get_ticks()
+        visualizer.draw_maze()
+        self.assertEqual(blinked, pygame.image.tostring(visualizer.screen, "RGB"))
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_seed_typing_redraws_field_only(self):
+        """Test that typing a seed presents only the input field, with the same pixels as a full redraw."""
+        visualizer = PygameMazeVisualizer(7, 12, cell_size=24, seed=5, walls=make_maze(7, 12, seed=5)[0])
+        visualizer.entering_seed = True
+        visualizer.seed_cursor_visible = True
+        visualizer.cursor_blink_time = pygame.time.get_ticks()
+        visualizer.draw_maze()
+        
+        visualizer.seed_input = "427"
+        visualizer._redraw_seed_field()
+        typed = pygame.image.tostring(visualizer.screen, "RGB")
+        visualizer.draw_maze()
+        self.assertEqual(typed, pygame.image.tostring(visualizer.screen, "RGB"))
+        
+        # Keys typed in the main loop update the field without a full redraw
+        draws = []
+        updates = []
+        original_draw = visualizer.draw_maze
+        original_update = pygame.display.update
+        visualizer.draw_maze = lambda: (draws.append(1), original_draw())
+        pygame.display.update = lambda *args: (updates.append(args), original_update(*args))
+        try:
+            visualizer.seed_input = ""
+            for char in "81":
+                pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=ord(char), unicode=char, mod=0, scancode=0))
+            pygame.event.post(pygame.event.Event(pygame.QUIT))
+            visualizer._dirty = False
+            visualizer.run()
+        finally:
+            pygame.display.update = original_update
+        self.assertEqual(visualizer.seed_input, "81")
+        self.assertEqual(draws, [])
+        self.assertEqual(updates, [(visualizer._seed_field_rect,)])
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_fonts_loaded_once(self):
+        """Test that drawing frames never constructs new fonts."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        
+        original_sysfont = pygame.font.SysFont
+        def fail_sysfont(*args, **kwargs):
+            raise AssertionError("SysFont called while drawing")
+        pygame.font.SysFont = fail_sysfont
+        try:
+            visualizer.selecting_start = True
+            visualizer.draw_maze()
+            visualizer.entering_seed = True
+            visualizer.draw_maze()
+        finally:
+            pygame.font.SysFont = original_sysfont
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_idle_frames_skip_drawing(self):
+        """Test that the main loop only redraws when something changed."""
+        visualizer = PygameMazeVisualizer(5, 5, seed=1, walls=make_maze(5, 5, seed=1)[0])
+        draws = []
+        original_draw = visualizer.draw_maze
+        visualizer.draw_maze = lambda: (draws.append(1), original_draw())
+        
+        # Let the loop idle for a few frames before quitting
+        pygame.time.set_timer(pygame.QUIT, 150, 1)
+        visualizer.run()
+        self.assertEqual(len(draws), 1, "Idle frames should not redraw the maze")
+    
     @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
     def test_simulated_user_interaction(self):
         """Simulate user interactions to test the visualizer logic."""
@@ -174,6 +385,45 @@ class TestPygameMazeVisualizer(unittest.TestCase):
         
         self.assertEqual(visualizer.start_pos, cell, "Start position was not updated")
         self.assertNotEqual(visualizer.path, old_path, "Path was not recalculated")
+
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_heuristic_reused_across_queries(self):
+        """Test that path queries to the same end reuse one heuristic table, even after regeneration."""
+        visualizer = PygameMazeVisualizer(10, 10, seed=1, walls=make_maze(10, 10, seed=1)[0])
+        tables = dict(visualizer.astar._h_cache)
+        self.assertEqual(len(tables), 1)
+
+        for start in ((2, 3), (5, 5), (0, 9)):
+            visualizer.selecting_start = True
+            visualizer.handle_cell_click(start)
+            visualizer.run_pending_query()
+        visualizer.regenerate_maze()
+
+        for key, table in tables.items():
+            self.assertIs(visualizer.astar._h_cache[key], table, "Heuristic table was recomputed")
+
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_clicks_collapse_into_one_query(self):
+        """Test that clicks defer the path search and collapse into one query."""
+        width, height = 10, 10
+        visualizer = PygameMazeVisualizer(width, height, seed=1, walls=make_maze(width, height, seed=1)[0])
+        
+        searches = []
+        original_find_path = visualizer.astar.find_path
+        visualizer.astar.find_path = lambda start, end: (searches.append((start, end)),
+                                                         original_find_path(start, end))[1]
+        
+        visualizer.selecting_start = True
+        visualizer.handle_cell_click((2, 3))
+        visualizer.selecting_end = True
+        visualizer.handle_cell_click((7, 8))
+        self.assertEqual(searches, [], "Clicks should not search immediately")
+        
+        visualizer.run_pending_query()
+        self.assertEqual(searches, [((2, 3), (7, 8))])
+        self.assertEqual(visualizer.path[0], (2, 3))
+        self.assertEqual(visualizer.path[-1], (7, 8))
+        self.assertIsNone(visualizer._pending_query)
     
     @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
     def test_mock_animation(self):
@@ -200,6 +450,45 @@ class TestPygameMazeVisualizer(unittest.TestCase):
             # Restore original delay function
             pygame.time.delay = original_delay
 
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_incremental_animation_matches_full_draw(self):
+        """Test that the incrementally animated frame matches a full redraw."""
+        visualizer = PygameMazeVisualizer(8, 8, seed=6, walls=make_maze(8, 8, seed=6)[0])
+        visualizer.animation_speed = 0
+        visualizer.start_pos = (3, 2)
+        
+        original_delay = pygame.time.delay
+        pygame.time.delay = lambda _: None
+        try:
+            visualizer.animate_pathfinding()
+        finally:
+            pygame.time.delay = original_delay
+        
+        animated = pygame.image.tostring(visualizer.screen, "RGB")
+        visualizer.draw_maze()
+        self.assertEqual(animated, pygame.image.tostring(visualizer.screen, "RGB"))
+    
+    @unittest.skipIf(PygameMazeVisualizer is None, "Pygame visualizer module not available")
+    def test_animation_follows_expansion_order(self):
+        """Test that the animation replays cells in the order A* expanded them."""
+        visualizer = PygameMazeVisualizer(8, 8, seed=6, walls=make_maze(8, 8, seed=6)[0])
+        visualizer.animation_speed = 20  # One display update per cell
+        
+        updates = []
+        original_delay = pygame.time.delay
+        original_update = pygame.display.update
+        pygame.time.delay = lambda _: None
+        pygame.display.update = lambda rects=None: updates.append(rects)
+        try:
+            visualizer.animate_pathfinding()
+        finally:
+            pygame.time.delay = original_delay
+            pygame.display.update = original_update
+        
+        replayed = [visualizer.pixel_to_cell((rects[0][0], rects[0][1])) for rects in updates if rects]
+        visualizer.astar.find_path(visualizer.start_pos, visualizer.end_pos)
+        self.assertEqual(replayed, visualizer.astar.get_explored_order())
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,140 @@
+import sys
+import os
+import io
+import unittest
+from contextlib import redirect_stdout
+from unittest.mock import patch
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+# Add parent directory to the import path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from maze_generator import MazeGenerator
+import visualizer as visualizer_module
+from visualizer import MazeVisualizer
+from tests._fixtures import make_maze
+
+
+class TestMazeVisualizer(unittest.TestCase):
+    def setUp(self):
+        """Generate a small seeded maze with its path and explored nodes."""
+        self.width, self.height = 6, 5
+        walls, path, explored = make_maze(self.width, self.height, seed=3)
+        self.walls = set(walls)
+        self.path = list(path)
+        self.explored = set(explored)
+        self.visualizer = MazeVisualizer(self.width, self.height, self.walls)
+    
+    def tearDown(self):
+        plt.close("all")
+    
+    def test_plot_walls_single_collection(self):
+        """Test that all walls are drawn by one LineCollection."""
+        self.visualizer.plot_matplotlib_maze(self.path, self.explored)
+        
+        collections = [c for c in plt.gca().collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(collections), 1)
+        # Every wall is drawn exactly once, with no line artists per wall
+        self.assertEqual(len(collections[0].get_segments()), len(self.walls))
+        self.assertEqual(len(plt.gca().lines), 1)
+        segments = {tuple(map(tuple, segment)) for segment in collections[0].get_segments()}
+        self.assertEqual(segments, {((x1, y1), (x2, y2)) for (x1, y1), (x2, y2) in self.walls})
+        
+        # The view is fixed to the maze rather than autoscaled to the artists
+        ax = plt.gca()
+        self.assertFalse(ax.get_autoscale_on())
+        self.assertEqual(ax.get_xlim(), (-0.5, self.width - 0.5))
+        self.assertEqual(ax.get_ylim(), (self.height - 0.5, -0.5))
+
+    def test_plot_reuses_figure(self):
+        """Test that repeated plots update the open figure instead of building a new one."""
+        fig = self.visualizer.plot_matplotlib_maze(self.path, self.explored)
+        self.assertIs(fig, plt.gcf())
+        wall_collection = self.visualizer._wall_lc
+        # The headless backend renders instead of showing, so the next call blits
+        self.assertIsNotNone(self.visualizer._background)
+
+        other_path = self.path[:3]
+        self.assertIs(self.visualizer.plot_matplotlib_maze(other_path), fig)
+        self.assertEqual(plt.get_fignums(), [fig.number])
+        self.assertIs(self.visualizer._wall_lc, wall_collection)
+        xs, ys = self.visualizer._path_line.get_data()
+        self.assertEqual(list(zip(xs, ys)), other_path)
+        self.assertEqual(len(self.visualizer._explored_scatter.get_offsets()), 0)
+
+        # A closed figure is rebuilt on the next call
+        plt.close(fig)
+        self.visualizer.plot_matplotlib_maze(self.path, self.explored)
+        self.assertIsNot(plt.gcf(), fig)
+
+
+    def test_text_maze_layout(self):
+        """Test the text rendering of a tiny maze with a path and explored cells."""
+        walls = {((1, 0), (1, 1)), ((0, 1), (1, 1))}
+        visualizer = MazeVisualizer(2, 2, walls)
+        
+        output = io.StringIO()
+        with redirect_stdout(output):
+            visualizer.print_text_maze([(0, 0), (0, 1)], {(0, 0), (0, 1), (1, 0)})
+        self.assertEqual(output.getvalue(),
+                         "+---+---+\n"
+                         "| S   · |\n"
+                         "+   +---+\n"
+                         "| E |   |\n"
+                         "+---+---+\n")
+    
+    def test_text_maze_binary_stdout(self):
+        """Test that the maze reaches a binary-backed stdout as encoded bytes after earlier text."""
+        raw = io.BytesIO()
+        stdout = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        with redirect_stdout(stdout):
+            print("header")
+            self.visualizer.print_text_maze(self.path, self.explored)
+        stdout.flush()
+        
+        expected = io.StringIO()
+        with redirect_stdout(expected):
+            self.visualizer.print_text_maze(self.path, self.explored)
+        self.assertEqual(raw.getvalue(), ("header\n" + expected.getvalue()).encode("utf-8"))
+    
+    def test_text_maze_wall_order(self):
+        """Test that walls are recognized whichever order their cells are given in."""
+        walls = MazeGenerator(self.width, self.height, seed=5).generate()
+        reversed_walls = {(b, a) for a, b in walls}
+        
+        outputs = []
+        for wall_set in (walls, reversed_walls):
+            output = io.StringIO()
+            with redirect_stdout(output):
+                MazeVisualizer(self.width, self.height, wall_set).print_text_maze(self.path, self.explored)
+            outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+    
+    def test_wall_helpers(self):
+        """Test that has_hwall and has_vwall agree with the wall set."""
+        walls = self.walls | {(b, a) for a, b in self.walls}
+        for x in range(self.width):
+            for y in range(self.height):
+                self.assertEqual(self.visualizer.has_hwall(x, y), ((x, y), (x, y + 1)) in walls)
+                self.assertEqual(self.visualizer.has_vwall(x, y), ((x, y), (x + 1, y)) in walls)
+        self.assertFalse(self.visualizer.has_hwall(-1, 0))
+        self.assertFalse(self.visualizer.has_vwall(0, -1))
+
+    def test_text_maze_backends(self):
+        """Test that the compiled and NumPy grid fills print the same maze."""
+        outputs = []
+        for numba_available in (True, False):
+            with patch.object(visualizer_module, "NUMBA_AVAILABLE", numba_available and visualizer_module.NUMBA_AVAILABLE):
+                output = io.StringIO()
+                with redirect_stdout(output):
+                    self.visualizer.print_text_maze(self.path, self.explored)
+                    self.visualizer.print_text_maze()
+                outputs.append(output.getvalue())
+        self.assertEqual(outputs[0], outputs[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,78 @@
+import sys
+from itertools import chain
 from typing import List, Set, Tuple, Optional
+import matplotlib
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 import numpy as np
 
+from astar import NUMBA_AVAILABLE, njit, walls_to_arrays
+
+
+# Backends that render to files only; plt.show() has nothing to display with them
+_NON_INTERACTIVE_BACKENDS = {"agg", "cairo", "pdf", "pgf", "ps", "svg", "template"}
+
+# Code points of the text maze characters
+_SPACE = ord(" ")
+_NEWLINE = ord("\n")
+_DASH = ord("-")
+_PIPE = ord("|")
+_PLUS = ord("+")
+_EXPLORED = ord("·")
+_PATH = ord("*")
+_START = ord("S")
+_END = ord("E")
+
+
+def _cells_array(cells, dtype) -> np.ndarray:
+    """Pack (x, y) cells into an (N, 2) array without building intermediate tuples.
+    
+    Args:
+        cells: Sized iterable of (x, y) cells, such as a path list or explored set
+        dtype: NumPy dtype of the result
+        
+    Returns:
+        Array of shape (len(cells), 2)
+    """
+    return np.fromiter(chain.from_iterable(cells), dtype=dtype, count=2 * len(cells)).reshape(-1, 2)
+
+
+@njit(cache=True)
+def _fill_text_grid_nb(wall_h, wall_v, marks, grid):
+    """Compiled single pass over the text maze grid.
+    
+    Writes the same code points as `MazeVisualizer._fill_text_grid` into
+    the caller-owned `grid` of shape (2 * H + 1, 4 * W + 2).
+    """
+    W, H = marks.shape
+    rows, cols = grid.shape
+    
+    for row in range(rows):
+        # Even rows hold posts and horizontal walls, odd rows cells and vertical walls
+        if row % 2 == 0:
+            y = row // 2 - 1
+            for col in range(cols - 1):
+                if col % 4 == 0:
+                    grid[row, col] = _PLUS
+                elif row == 0 or row == rows - 1 or wall_h[col // 4, y]:
+                    grid[row, col] = _DASH
+                else:
+                    grid[row, col] = _SPACE
+        else:
+            y = row // 2
+            for col in range(cols - 1):
+                x = col // 4
+                if col % 4 == 0:
+                    if col == 0 or col == cols - 2 or wall_v[x - 1, y]:
+                        grid[row, col] = _PIPE
+                    else:
+                        grid[row, col] = _SPACE
+                elif col % 4 == 2 and marks[x, y] != 0:
+                    grid[row, col] = marks[x, y]
+                else:
+                    grid[row, col] = _SPACE
+        grid[row, cols - 1] = _NEWLINE
+
 
 class MazeVisualizer:
     def __init__(self, width: int, height: int, walls: Set[Tuple[Tuple[int, int], Tuple[int, int]]]):
@@ -9,6 +80,47 @@ class MazeVisualizer:
         self.width = width
         self.height = height
         self.walls = walls
+        # Walls as edge arrays, so a wall test is one index instead of a
+        # tuple hash: _wall_h[x, y] separates (x, y) from (x, y + 1),
+        # _wall_v[x, y] separates (x, y) from (x + 1, y). The conversion
+        # accepts either cell order, so no normalized copy of the set is kept
+        self._wall_h, self._wall_v = walls_to_arrays(width, height, walls)
+        # The same walls as one structure-of-arrays block, a row of
+        # x1, y1, x2, y2 per wall, that reshapes straight into line segments
+        self._wall_coords = np.fromiter(chain.from_iterable(chain.from_iterable(walls)),
+                                        dtype=np.int32, count=4 * len(walls)).reshape(-1, 4)
+        # Code point buffer that print_text_maze renders into
+        self._text_grid = np.empty((2 * height + 1, 4 * width + 2), dtype=np.uint32)
+        # Figure reused by plot_matplotlib_maze while it stays open
+        self._fig = None
+        self._ax = None
+        self._background = None
+    
+    def has_hwall(self, x: int, y: int) -> bool:
+        """Check for a wall between (x, y) and the cell below it.
+        
+        Args:
+            x: Column of the upper cell
+            y: Row of the upper cell
+        
+        Returns:
+            True if the cells are separated by a wall, False otherwise or
+            if either cell lies outside the maze
+        """
+        return 0 <= x < self.width and 0 <= y < self.height - 1 and bool(self._wall_h[x, y])
+    
+    def has_vwall(self, x: int, y: int) -> bool:
+        """Check for a wall between (x, y) and the cell to its right.
+        
+        Args:
+            x: Column of the left cell
+            y: Row of the left cell
+        
+        Returns:
+            True if the cells are separated by a wall, False otherwise or
+            if either cell lies outside the maze
+        """
+        return 0 <= x < self.width - 1 and 0 <= y < self.height and bool(self._wall_v[x, y])
     
     def print_text_maze(self, path: Optional[List[Tuple[int, int]]] = None, explored: Optional[Set[Tuple[int, int]]] = None):
         """Print the maze in text format with optional path and explored nodes.
@@ -17,93 +129,165 @@ class MazeVisualizer:
             path: Optional list of coordinates representing the solution path
             explored: Optional set of coordinates representing explored nodes
         """
-        # Initialize the maze representation with walls represented
-        # Top boundary
-        print("+" + "---+" * self.width)
-        
-        for y in range(self.height):
-            # Row for cells and right walls
-            row = "|"
-            bottom_row = "+"
-            
-            for x in range(self.width):
-                # Determine cell content
-                cell = (x, y)
-                
-                # Handle path visualization
-                if path and cell in path:
-                    if cell == path[0]:
-                        cell_str = " S "  # Start
-                    elif cell == path[-1]:
-                        cell_str = " E "  # End
-                    else:
-                        cell_str = " * "  # Path
-                # Handle explored cells visualization
-                elif explored and cell in explored:
-                    cell_str = " · "  # Explored
-                else:
-                    cell_str = "   "  # Empty
-                
-                row += cell_str
-                
-                # Check if there's a wall to the right
-                if x < self.width - 1:
-                    if ((x, y), (x + 1, y)) in self.walls or ((x + 1, y), (x, y)) in self.walls:
-                        row += "|"
-                    else:
-                        row += " "
-                else:
-                    row += "|"  # Right boundary
-                    
-                # Check if there's a wall below
-                if y < self.height - 1:
-                    if ((x, y), (x, y + 1)) in self.walls or ((x, y + 1), (x, y)) in self.walls:
-                        bottom_row += "---+"
-                    else:
-                        bottom_row += "   +"
-                else:
-                    bottom_row += "---+"  # Bottom boundary
-                    
-            print(row)
-            print(bottom_row)
+        # Code point of the marker shown in each cell, 0 for none; later markers win
+        marks = np.zeros((self.width, self.height), dtype=np.uint32)
+        if explored:
+            cells = _cells_array(explored, np.intp)
+            marks[cells[:, 0], cells[:, 1]] = _EXPLORED
+        if path:
+            cells = _cells_array(path, np.intp)
+            marks[cells[:, 0], cells[:, 1]] = _PATH
+            marks[path[-1]] = _END
+            marks[path[0]] = _START
+        
+        grid = self._text_grid
+        if NUMBA_AVAILABLE:
+            _fill_text_grid_nb(self._wall_h, self._wall_v, marks, grid)
+        else:
+            self._fill_text_grid(marks, grid)
+        
+        # The code point grid doubles as one UTF-32 string of the whole picture
+        text = grid.ravel().view(f"<U{grid.size}")[0]
+        
+        # Encode once and hand the bytes to the binary buffer in a single write;
+        # streams without one (e.g. io.StringIO) take the text as is
+        stdout = sys.stdout
+        buffer = getattr(stdout, "buffer", None)
+        if buffer is None:
+            stdout.write(text)
+            return
+        stdout.flush()
+        buffer.write(text.encode(stdout.encoding or "utf-8", stdout.errors or "strict"))
+        buffer.flush()
+    
+    def _fill_text_grid(self, marks: np.ndarray, grid: np.ndarray):
+        """Fill the text maze grid with whole-array NumPy assignments.
+        
+        Args:
+            marks: Marker code point of each cell, indexed [x, y]
+            grid: Code point array of shape (2 * height + 1, 4 * width + 2)
+        """
+        # One character per cell of the picture, plus a newline column
+        grid.fill(_SPACE)
+        grid[:, -1] = _NEWLINE
+        
+        # Outer boundary, then the posts at every grid corner
+        grid[[0, -1], 1:-1] = _DASH
+        grid[1::2, [0, -2]] = _PIPE
+        grid[::2, 0:-1:4] = _PLUS
+        
+        # Walls below cells span the three characters of the cell above them
+        xs, ys = np.nonzero(self._wall_h)
+        for offset in range(1, 4):
+            grid[2 * ys + 2, 4 * xs + offset] = _DASH
+        
+        # Walls right of cells sit in the separator column after them
+        xs, ys = np.nonzero(self._wall_v)
+        grid[2 * ys + 1, 4 * xs + 4] = _PIPE
+        
+        # Cell markers go in the middle character
+        xs, ys = np.nonzero(marks)
+        grid[2 * ys + 1, 4 * xs + 2] = marks[xs, ys]
     
     def plot_matplotlib_maze(self, path: Optional[List[Tuple[int, int]]] = None, explored: Optional[Set[Tuple[int, int]]] = None):
         """Plot the maze using matplotlib.
         
+        The figure and its wall collection are built on the first call and
+        kept. While that figure is still open, later calls only update the
+        path and explored artists and blit them over the cached background.
+        
+        With a non-interactive backend such as Agg the new figure is only
+        rendered, not shown, so headless runs never enter plt.show().
+        
         Args:
             path: Optional list of coordinates representing the solution path
             explored: Optional set of coordinates representing explored nodes
+            
+        Returns:
+            The matplotlib figure, ready for savefig without another render
         """
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._build_figure()
+            self._set_dynamic_data(path, explored)
+            if matplotlib.get_backend().lower() in _NON_INTERACTIVE_BACKENDS:
+                self._fig.canvas.draw()
+            else:
+                plt.show()
+            return self._fig
+        
+        self._set_dynamic_data(path, explored)
+        canvas = self._fig.canvas
+        if self._background is None:
+            # Nothing has been drawn yet, so there is no background to reuse
+            canvas.draw_idle()
+            return self._fig
+        canvas.restore_region(self._background)
+        self._draw_dynamic_artists()
+        canvas.blit(self._fig.bbox)
+        canvas.flush_events()
+        return self._fig
+    
+    def _build_figure(self):
+        """Create the figure with the static walls and empty path/explored artists."""
         fig, ax = plt.subplots(figsize=(10, 10))
+        self._fig, self._ax = fig, ax
+        self._background = None
         
-        # Draw the cells
-        for y in range(self.height):
-            for x in range(self.width):
-                # Draw the walls
-                for (x1, y1), (x2, y2) in self.walls:
-                    plt.plot([x1, x2], [y1, y2], 'k-', linewidth=2)
+        # Path and explored artists are left out of normal draws when the
+        # canvas can blit, so the saved background only holds the walls
+        animated = fig.canvas.supports_blit
         
-        # Draw explored nodes if provided
-        if explored:
-            ex, ey = zip(*explored) if explored else ([], [])
-            plt.scatter(ex, ey, color='lightblue', s=100, alpha=0.5)
-            
-        # Draw the path if provided
-        if path:
-            # Draw start and end points
-            plt.scatter([path[0][0]], [path[0][1]], color='green', s=200, marker='o')
-            plt.scatter([path[-1][0]], [path[-1][1]], color='red', s=200, marker='o')
-            
-            # Draw path
-            path_x, path_y = zip(*path)
-            plt.plot(path_x, path_y, 'b-', linewidth=3)
+        # Fix the view up front so adding artists never triggers autoscaling
+        ax.set_xlim(-0.5, self.width - 0.5)
+        ax.set_ylim(self.height - 0.5, -0.5)  # Flip y-axis to match maze coordinates
+        ax.set_autoscale_on(False)
+        
+        # Draw all walls as one collection instead of one artist per segment
+        self._wall_lc = LineCollection(self._wall_coords.reshape(-1, 2, 2), colors='k', linewidths=2)
+        ax.add_collection(self._wall_lc, autolim=False)
+        
+        # Explored nodes, then start and end points, then the path on top
+        self._explored_scatter = ax.scatter([], [], color='lightblue', s=100, alpha=0.5, animated=animated)
+        self._start_scatter = ax.scatter([], [], color='green', s=200, marker='o', animated=animated)
+        self._end_scatter = ax.scatter([], [], color='red', s=200, marker='o', animated=animated)
+        self._path_line, = ax.plot([], [], 'b-', linewidth=3, animated=animated)
+        self._dynamic_artists = [self._explored_scatter, self._start_scatter, self._end_scatter, self._path_line]
         
         # Set up the plot
-        plt.grid(False)
-        plt.xlim(-0.5, self.width - 0.5)
-        plt.ylim(self.height - 0.5, -0.5)  # Flip y-axis to match maze coordinates
-        plt.title("Maze with A* Path")
-        plt.axis('off')
-        plt.tight_layout()
-        
-        plt.show()
\ No newline at end of file
+        ax.grid(False)
+        ax.set_title("Maze with A* Path")
+        ax.axis('off')
+        fig.tight_layout()
+        
+        if animated:
+            fig.canvas.mpl_connect('draw_event', self._on_draw)
+    
+    def _set_dynamic_data(self, path: Optional[List[Tuple[int, int]]], explored: Optional[Set[Tuple[int, int]]]):
+        """Point the path and explored artists at new data."""
+        explored_xy = np.empty((0, 2))
+        if explored:
+            explored_xy = _cells_array(explored, np.float64)
+        self._explored_scatter.set_offsets(explored_xy)
+        
+        if path:
+            path_xy = _cells_array(path, np.float64)
+            self._start_scatter.set_offsets(path_xy[:1])
+            self._end_scatter.set_offsets(path_xy[-1:])
+            self._path_line.set_data(path_xy[:, 0], path_xy[:, 1])
+        else:
+            self._start_scatter.set_offsets(np.empty((0, 2)))
+            self._end_scatter.set_offsets(np.empty((0, 2)))
+            self._path_line.set_data([], [])
+    
+    def _on_draw(self, event):
+        """Save the freshly drawn static background and draw the dynamic artists over it."""
+        canvas = self._fig.canvas
+        if event is not None and event.canvas is not canvas:
+            return
+        self._background = canvas.copy_from_bbox(self._fig.bbox)
+        self._draw_dynamic_artists()
+    
+    def _draw_dynamic_artists(self):
+        """Draw the path and explored artists onto the canvas."""
+        for artist in self._dynamic_artists:
+            self._ax.draw_artist(artist)